@@ -60,6 +60,8 @@ class EstruturaLinear(ABC):
 
 class Node:
     """Nó para a Lista Simplesmente Encadeada."""
+    __slots__ = ('data', 'next')
+
     def __init__(self, data):
         self.data = data
         self.next = None
@@ -69,6 +71,8 @@ class Node:
 
 class DoubleNode(Node):
     """Nó para a Lista Duplamente Encadeada."""
+    __slots__ = ('prev',)
+
     def __init__(self, data):
         super().__init__(data)
         self.prev = None
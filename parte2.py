@@ -3,10 +3,18 @@ Trabalho de Programação Orientada a Objetos: Hierarquia de Classes de Estrutur
 
 Parte 2: Classe Array
 
-Este arquivo contém as classes base e a implementação da classe Array.
+Este arquivo contém as classes base e a implementação da classe Array
+(e de suas variantes) e das classes Matriz e MatrizEsparsa.
 """
 
 from abc import ABC, abstractmethod
+import array
+import operator
+
+try:
+    import numpy as np
+except ImportError:  # NumPy é opcional: sem ele, a Matriz usa Python puro
+    np = None
 
 # =============================================================================
 # CLASSE BASE ABSTRATA (Da Parte 1)
@@ -54,6 +62,8 @@ class EstruturaLinear(ABC):
 
 class Node:
     """Nó para a Lista Simplesmente Encadeada."""
+    __slots__ = ('data', 'next')
+
     def __init__(self, data):
         self.data = data
         self.next = None
@@ -63,6 +73,8 @@ class Node:
 
 class DoubleNode(Node):
     """Nó para a Lista Duplamente Encadeada."""
+    __slots__ = ('prev',)
+
     def __init__(self, data):
         super().__init__(data)
         self.prev = None
@@ -78,38 +90,146 @@ class Array(EstruturaLinear):
     """
     Implementação de um Array Dinâmico que se expande quando necessário.
     Herda de EstruturaLinear.
+
+    Com typecode (ex: Array(typecode='d')), os elementos ficam em um buffer
+    contíguo do módulo array, sem objetos Python por elemento, e podem ser
+    lidos sem cópia via memoryview (NumPy, struct, arquivos).
     """
-    def __init__(self, initial_capacity=10):
+    def __init__(self, initial_capacity=10, growth_factor=2, on_resize=None, typecode=None):
         """
         Construtor do Array.
         :param initial_capacity: A capacidade inicial do array interno.
+        :param growth_factor: Fator de crescimento usado quando o array enche (> 1).
+        :param on_resize: Função opcional chamada como on_resize(antiga, nova)
+                          a cada redimensionamento.
+        :param typecode: Código de tipo do módulo array ('d', 'i', 'b', ...).
+                         Se None, o array guarda objetos Python quaisquer.
         """
-        self._data = [None] * initial_capacity
+        if initial_capacity < 0:
+            raise ValueError("A capacidade inicial não pode ser negativa.")
+        if growth_factor <= 1:
+            raise ValueError("O fator de crescimento deve ser maior que 1.")
+        self._typecode = typecode
+        self._data = self._alloc(initial_capacity)
         self._size = 0
         self._capacity = initial_capacity
+        self._min_capacity = initial_capacity
+        self._growth_factor = growth_factor
+        self._on_resize = on_resize
 
     def __len__(self):
         """Retorna o número de elementos armazenados no array."""
         return self._size
 
+    def _alloc(self, n):
+        """Cria um bloco de armazenamento vazio com n posições."""
+        if self._typecode is None:
+            return [None] * n
+        return array.array(self._typecode, bytes(n * array.array(self._typecode).itemsize))
+
+    def _block(self, iterable):
+        """Converte um iterável em um bloco compatível com o armazenamento interno."""
+        if self._typecode is None:
+            return list(iterable)
+        return array.array(self._typecode, iterable)
+
+    @property
+    def typecode(self):
+        """Código de tipo do armazenamento (None para objetos Python)."""
+        return self._typecode
+
+    def view(self):
+        """
+        Retorna um memoryview (sem cópia) sobre os elementos de um array tipado.
+        A visão continua válida até o próximo redimensionamento.
+        Lança um TypeError se o array não for tipado.
+        """
+        if self._typecode is None:
+            raise TypeError("Apenas arrays com typecode expõem o protocolo de buffer.")
+        return memoryview(self._data)[:self._size]
+
+    def __buffer__(self, flags):
+        """Protocolo de buffer (Python 3.12+): permite memoryview(arr) diretamente."""
+        return self.view()
+
+    def tobytes(self):
+        """Retorna os bytes dos elementos de um array tipado."""
+        return self.view().tobytes()
+
     def _resize(self, new_capacity):
         """
         Método privado para redimensionar o array interno.
-        Normalmente, dobra a capacidade.
+        Copia os elementos em bloco (fatia) e avisa o callback on_resize, se houver.
         """
-        print(f"--- Array redimensionando de {self._capacity} para {new_capacity} ---")
-        new_data = [None] * new_capacity
-        for i in range(self._size):
-            new_data[i] = self._data[i]
+        old_capacity = self._capacity
+        new_data = self._alloc(new_capacity)
+        new_data[:self._size] = self._data[:self._size]
         self._data = new_data
         self._capacity = new_capacity
+        if self._on_resize is not None:
+            self._on_resize(old_capacity, new_capacity)
+
+    def _grow_to(self, min_capacity):
+        """
+        Garante espaço para pelo menos min_capacity elementos,
+        crescendo geometricamente pelo fator de crescimento.
+        """
+        if min_capacity <= self._capacity:
+            return
+        new_capacity = max(min_capacity, int(self._capacity * self._growth_factor), 1)
+        self._resize(new_capacity)
+
+    def _maybe_shrink(self):
+        """
+        Devolve capacidade quando o array fica muito vazio.
+        Usa histerese: só encolhe quando o tamanho cai abaixo de
+        capacidade / fator², e encolhe apenas para capacidade / fator,
+        evitando redimensionamentos alternados perto do limite.
+        """
+        limite = self._capacity / (self._growth_factor ** 2)
+        if self._capacity > self._min_capacity and self._size <= limite:
+            new_capacity = max(int(self._capacity / self._growth_factor), self._size, self._min_capacity)
+            if new_capacity < self._capacity:
+                self._resize(new_capacity)
+
+    def reserve(self, n):
+        """
+        Garante capacidade para pelo menos n elementos (redimensiona no máximo uma vez).
+        Útil antes de cargas em lote, quando o número de itens é conhecido.
+        """
+        if n > self._capacity:
+            self._resize(n)
+
+    def shrink_to_fit(self):
+        """Reduz a capacidade interna ao número de elementos armazenados."""
+        if self._capacity != self._size:
+            self._resize(self._size)
+        self._min_capacity = min(self._min_capacity, self._size)
+
+    def _fatia_interna(self, index):
+        """
+        Converte uma fatia lógica na fatia equivalente sobre o buffer interno.
+        O buffer tem a capacidade inteira, então um stop negativo (passo negativo
+        até o índice 0) não pode ser repassado: ali -1 seria a última posição da
+        capacidade, e não "antes do índice 0".
+        """
+        start, stop, step = index.indices(self._size)
+        if not range(start, stop, step):
+            return slice(0, 0)
+        return slice(start, stop if stop >= 0 else None, step)
 
     def __getitem__(self, index):
         """
         Permite acesso via indexação para consulta (Rvalue).
-        Ex: var = arr[i]
+        Ex: var = arr[i]  ou  sub = arr[i:j]
         Lança um IndexError se o índice estiver fora dos limites.
         """
+        if isinstance(index, slice):
+            itens = self._data[self._fatia_interna(index)]
+            novo = Array(len(itens), growth_factor=self._growth_factor, typecode=self._typecode)
+            novo._data[:len(itens)] = itens
+            novo._size = len(itens)
+            return novo
         if not 0 <= index < self._size:
             raise IndexError("Índice fora dos limites do array.")
         return self._data[index]
@@ -117,13 +237,45 @@ class Array(EstruturaLinear):
     def __setitem__(self, index, value):
         """
         Permite atribuição via indexação para atualização (Lvalue).
-        Ex: arr[i] = valor
+        Ex: arr[i] = valor  ou  arr[i:j] = iteravel
         Lança um IndexError se o índice estiver fora dos limites.
         """
+        if isinstance(index, slice):
+            start, stop, step = index.indices(self._size)
+            if step == 1:
+                self._replace_range(start, max(start, stop), value)
+                return
+            itens = self._block(value)
+            posicoes = range(start, stop, step)
+            if len(itens) != len(posicoes):
+                raise ValueError("Fatia estendida exige o mesmo número de itens.")
+            self._data[self._fatia_interna(index)] = itens
+            return
         if not 0 <= index < self._size:
             raise IndexError("Índice fora dos limites do array.")
         self._data[index] = value
 
+    def _replace_range(self, start, stop, iterable):
+        """
+        Substitui os itens em [start, stop) pelos itens do iterável.
+        Redimensiona no máximo uma vez e desloca a cauda em um único
+        movimento de bloco.
+        """
+        itens = self._block(iterable)
+        k = len(itens)
+        new_size = self._size - (stop - start) + k
+        self._grow_to(new_size)
+        if start + k != stop:
+            # Move a cauda inteira de uma vez (a fatia da direita é copiada antes)
+            self._data[start + k:new_size] = self._data[stop:self._size]
+            if new_size < self._size:
+                self._data[new_size:self._size] = self._alloc(self._size - new_size)
+        self._data[start:start + k] = itens
+        old_size = self._size
+        self._size = new_size
+        if new_size < old_size:
+            self._maybe_shrink()
+
     def insert(self, item, index=None):
         """
         Insere um item no array.
@@ -138,15 +290,28 @@ class Array(EstruturaLinear):
 
         # Redimensiona se a capacidade for atingida
         if self._size == self._capacity:
-            self._resize(2 * self._capacity)
+            self._grow_to(self._size + 1)
 
-        # Desloca elementos para a direita para abrir espaço
-        for i in range(self._size, index, -1):
-            self._data[i] = self._data[i-1]
+        # Desloca a cauda para a direita em bloco para abrir espaço
+        if index < self._size:
+            self._data[index + 1:self._size + 1] = self._data[index:self._size]
 
         self._data[index] = item
         self._size += 1
 
+    def insert_many(self, index, iterable):
+        """
+        Insere todos os itens do iterável a partir da posição index,
+        preservando a ordem. Redimensiona no máximo uma vez.
+        """
+        if not 0 <= index <= self._size:
+            raise IndexError("Índice de inserção fora dos limites.")
+        self._replace_range(index, index, iterable)
+
+    def extend(self, iterable):
+        """Insere todos os itens do iterável no final do array."""
+        self._replace_range(self._size, self._size, iterable)
+
     def remove(self, index):
         """
         Remove e retorna o item no índice especificado.
@@ -156,14 +321,25 @@ class Array(EstruturaLinear):
             raise IndexError("Índice de remoção fora dos limites.")
 
         item_removido = self._data[index]
-        # Desloca elementos para a esquerda
-        for i in range(index, self._size - 1):
-            self._data[i] = self._data[i+1]
+        # Desloca a cauda para a esquerda em bloco
+        self._data[index:self._size - 1] = self._data[index + 1:self._size]
 
-        self._data[self._size - 1] = None # Limpa a última posição
+        self._data[self._size - 1:self._size] = self._alloc(1) # Limpa a última posição
         self._size -= 1
+        self._maybe_shrink()
         return item_removido
 
+    def remove_range(self, start, stop):
+        """
+        Remove e retorna os itens em [start, stop) (lista, ou array.array se tipado).
+        Lança um IndexError se o intervalo for inválido.
+        """
+        if not 0 <= start <= stop <= self._size:
+            raise IndexError("Intervalo de remoção fora dos limites.")
+        removidos = self._data[start:stop]
+        self._replace_range(start, stop, ())
+        return removidos
+
     def find(self, key):
         """
         Encontra e retorna a primeira ocorrência do item com a chave especificada.
@@ -178,6 +354,576 @@ class Array(EstruturaLinear):
         """Representação em string do Array."""
         return f"Array: {str([self._data[i] for i in range(self._size)])}"
 
+# =============================================================================
+# CLASSE ARRAY COM GAP BUFFER (LACUNA MÓVEL)
+# =============================================================================
+
+class ArrayGapBuffer(EstruturaLinear):
+    """
+    Variante do Array que mantém uma lacuna (gap) móvel no ponto da última edição.
+    Inserções e remoções próximas umas das outras custam O(1) amortizado, pois
+    só os elementos entre a lacuna e a nova posição precisam ser movidos.
+    Possui a mesma interface e semântica de indexação do Array.
+    """
+    def __init__(self, initial_capacity=10, growth_factor=2):
+        """
+        Construtor do ArrayGapBuffer.
+        :param initial_capacity: A capacidade inicial do buffer interno.
+        :param growth_factor: Fator de crescimento usado quando a lacuna se esgota (> 1).
+        """
+        if initial_capacity < 0:
+            raise ValueError("A capacidade inicial não pode ser negativa.")
+        if growth_factor <= 1:
+            raise ValueError("O fator de crescimento deve ser maior que 1.")
+        self._data = [None] * initial_capacity
+        self._gap_start = 0
+        self._gap_end = initial_capacity
+        self._capacity = initial_capacity
+        self._growth_factor = growth_factor
+
+    def __len__(self):
+        """Retorna o número de elementos armazenados (capacidade menos a lacuna)."""
+        return self._capacity - (self._gap_end - self._gap_start)
+
+    def _physical(self, index):
+        """Converte um índice lógico na posição física do buffer, pulando a lacuna."""
+        if index < self._gap_start:
+            return index
+        return index + (self._gap_end - self._gap_start)
+
+    def _move_gap(self, index):
+        """
+        Move o início da lacuna para o índice lógico informado,
+        deslocando em bloco apenas os elementos entre as duas posições.
+        """
+        # Só as posições que os itens deslocados deixaram vagas (e que caem na nova
+        # lacuna) são limpas; o resto da lacuna já estava limpo. Custo: O(n movidos).
+        if index < self._gap_start:
+            n = self._gap_start - index
+            self._data[self._gap_end - n:self._gap_end] = self._data[index:self._gap_start]
+            self._gap_start = index
+            self._gap_end -= n
+            vagas = range(index, min(index + n, self._gap_end))
+        elif index > self._gap_start:
+            n = index - self._gap_start
+            antigo_fim = self._gap_end
+            self._data[self._gap_start:index] = self._data[antigo_fim:antigo_fim + n]
+            self._gap_start = index
+            self._gap_end += n
+            vagas = range(max(antigo_fim, index), self._gap_end)
+        else:
+            return
+        # Não mantém referências a itens que já foram copiados para o outro lado
+        self._data[vagas.start:vagas.stop] = [None] * len(vagas)
+
+    def _grow(self):
+        """Aumenta a capacidade, reabrindo a lacuna no mesmo ponto."""
+        new_capacity = max(int(self._capacity * self._growth_factor), self._capacity + 1)
+        extra = new_capacity - self._capacity
+        self._data = (self._data[:self._gap_start] + [None] * (self._gap_end - self._gap_start + extra)
+                      + self._data[self._gap_end:])
+        self._gap_end += extra
+        self._capacity = new_capacity
+
+    def __getitem__(self, index):
+        """
+        Permite acesso via indexação para consulta (Rvalue).
+        Ex: var = gap[i]  ou  sub = gap[i:j]
+        Lança um IndexError se o índice estiver fora dos limites.
+        """
+        if isinstance(index, slice):
+            itens = self._items()[index]
+            novo = ArrayGapBuffer(len(itens), growth_factor=self._growth_factor)
+            novo._data[:len(itens)] = itens
+            novo._gap_start = novo._gap_end = len(itens)
+            return novo
+        if not 0 <= index < len(self):
+            raise IndexError("Índice fora dos limites do array.")
+        return self._data[self._physical(index)]
+
+    def __setitem__(self, index, value):
+        """
+        Permite atribuição via indexação para atualização (Lvalue).
+        Ex: gap[i] = valor  ou  gap[i:j] = iteravel
+        Lança um IndexError se o índice estiver fora dos limites.
+        """
+        if isinstance(index, slice):
+            start, stop, step = index.indices(len(self))
+            if step == 1:
+                self._replace_range(start, max(start, stop), value)
+                return
+            itens = list(value)
+            posicoes = range(start, stop, step)
+            if len(itens) != len(posicoes):
+                raise ValueError("Fatia estendida exige o mesmo número de itens.")
+            for posicao, item in zip(posicoes, itens):
+                self._data[self._physical(posicao)] = item
+            return
+        if not 0 <= index < len(self):
+            raise IndexError("Índice fora dos limites do array.")
+        self._data[self._physical(index)] = value
+
+    def _replace_range(self, start, stop, iterable):
+        """
+        Substitui os itens em [start, stop) pelos itens do iterável.
+        A lacuna é movida até start, absorve os itens substituídos e
+        recebe os novos.
+        """
+        itens = list(iterable)
+        self._move_gap(start)
+        removidos = stop - start
+        self._data[self._gap_end:self._gap_end + removidos] = [None] * removidos
+        self._gap_end += removidos
+        while self._gap_end - self._gap_start < len(itens):
+            self._grow()
+        self._data[self._gap_start:self._gap_start + len(itens)] = itens
+        self._gap_start += len(itens)
+
+    def insert(self, item, index=None):
+        """
+        Insere um item no array.
+        Se o índice não for fornecido, insere no final.
+        A lacuna é movida até o índice e o item ocupa sua primeira posição.
+        """
+        if index is None:
+            index = len(self)
+
+        if not 0 <= index <= len(self):
+            raise IndexError("Índice de inserção fora dos limites.")
+
+        if self._gap_start == self._gap_end:
+            self._grow()
+
+        self._move_gap(index)
+        self._data[self._gap_start] = item
+        self._gap_start += 1
+
+    def remove(self, index):
+        """
+        Remove e retorna o item no índice especificado.
+        A lacuna é movida até o índice e absorve a posição removida.
+        Lança um IndexError se o índice estiver fora dos limites.
+        """
+        if not 0 <= index < len(self):
+            raise IndexError("Índice de remoção fora dos limites.")
+
+        self._move_gap(index)
+        item_removido = self._data[self._gap_end]
+        self._data[self._gap_end] = None
+        self._gap_end += 1
+        return item_removido
+
+    def find(self, key):
+        """
+        Encontra e retorna a primeira ocorrência do item com a chave especificada.
+        Lança um ValueError se a chave não for encontrada.
+        """
+        for item in self._items():
+            if item == key:
+                return item
+        raise ValueError(f"Chave '{key}' não encontrada.")
+
+    def _items(self):
+        """Retorna uma lista com os itens em ordem lógica (sem a lacuna)."""
+        return self._data[:self._gap_start] + self._data[self._gap_end:]
+
+    def __str__(self):
+        """Representação em string do ArrayGapBuffer."""
+        return f"ArrayGapBuffer: {str(self._items())}"
+
+# =============================================================================
+# CLASSE MATRIZ (BUFFER CONTÍGUO, ORDEM POR LINHAS)
+# =============================================================================
+
+class Matriz:
+    """
+    Matriz densa armazenada em um único buffer contíguo, em ordem por linhas
+    (o elemento [i, j] fica na posição i * colunas + j).
+
+    Sem typecode, guarda objetos Python em uma lista plana. Com typecode
+    (ex: 'd'), usa um array.array e, se o NumPy estiver instalado, as operações
+    de matriz inteira (aritmética, transposta, produto) são feitas pelo NumPy
+    sobre o próprio buffer, sem cópia na entrada.
+    """
+    def __init__(self, linhas, colunas, valor=0, typecode=None, usar_numpy=True):
+        """
+        Construtor da Matriz.
+        :param linhas: Número de linhas.
+        :param colunas: Número de colunas.
+        :param valor: Valor inicial de todas as células.
+        :param typecode: Código de tipo do módulo array, ou None para objetos Python.
+        :param usar_numpy: Usa o NumPy (se disponível) nas operações de matriz tipada.
+        """
+        if linhas < 0 or colunas < 0:
+            raise ValueError("As dimensões da matriz não podem ser negativas.")
+        self.linhas = linhas
+        self.colunas = colunas
+        self._typecode = typecode
+        self._usar_numpy = usar_numpy
+        if typecode is None:
+            self._data = [valor] * (linhas * colunas)
+        else:
+            self._data = array.array(typecode, [valor]) * (linhas * colunas)
+
+    @classmethod
+    def _from_flat(cls, linhas, colunas, valores, typecode, usar_numpy=True):
+        """
+        Cria uma matriz a partir de uma sequência plana (ordem por linhas).
+        Se os valores não couberem no typecode (ex: floats em 'i'), usa 'd'.
+        """
+        mat = cls.__new__(cls)
+        mat.linhas = linhas
+        mat.colunas = colunas
+        mat._usar_numpy = usar_numpy
+        if typecode is None:
+            mat._typecode = None
+            mat._data = list(valores)
+        else:
+            try:
+                mat._data = array.array(typecode, valores)
+            except TypeError:
+                typecode = 'd'
+                mat._data = array.array(typecode, valores)
+            mat._typecode = typecode
+        return mat
+
+    @classmethod
+    def from_rows(cls, rows, typecode=None, usar_numpy=True):
+        """
+        Cria uma matriz a partir de uma sequência de linhas (ex: lista de listas).
+        Lança um ValueError se as linhas tiverem tamanhos diferentes.
+        """
+        rows = [list(row) for row in rows]
+        colunas = len(rows[0]) if rows else 0
+        if any(len(row) != colunas for row in rows):
+            raise ValueError("Todas as linhas devem ter o mesmo número de colunas.")
+        valores = [x for row in rows for x in row]
+        return cls._from_flat(len(rows), colunas, valores, typecode, usar_numpy)
+
+    @property
+    def shape(self):
+        """Dimensões da matriz como (linhas, colunas)."""
+        return (self.linhas, self.colunas)
+
+    # --- Integração opcional com NumPy ---
+    def _acelerada(self):
+        """Indica se as operações desta matriz podem usar o NumPy."""
+        return np is not None and self._usar_numpy and self._typecode is not None
+
+    def to_numpy(self):
+        """
+        Retorna um ndarray (linhas x colunas) que compartilha o buffer da matriz.
+        Lança um RuntimeError se o NumPy não estiver disponível e um TypeError
+        se a matriz não for tipada.
+        """
+        if np is None:
+            raise RuntimeError("NumPy não está disponível.")
+        if self._typecode is None:
+            raise TypeError("Apenas matrizes com typecode compartilham o buffer com o NumPy.")
+        return np.frombuffer(self._data, dtype=self._typecode).reshape(self.linhas, self.colunas)
+
+    @classmethod
+    def _from_numpy(cls, resultado):
+        """Cria uma matriz tipada a partir de um ndarray 2D (uma única cópia em bloco)."""
+        resultado = np.ascontiguousarray(resultado)
+        typecode = resultado.dtype.char if resultado.dtype.char in array.typecodes else 'd'
+        resultado = resultado.astype(typecode, copy=False)
+        mat = cls.__new__(cls)
+        mat.linhas, mat.colunas = resultado.shape
+        mat._typecode = typecode
+        mat._usar_numpy = True
+        mat._data = array.array(typecode)
+        mat._data.frombytes(resultado.tobytes())
+        return mat
+
+    # --- Indexação ---
+    def _range(self, index, limite):
+        """Converte um índice (int ou slice) de uma dimensão em um range."""
+        if isinstance(index, slice):
+            return range(limite)[index]
+        if not 0 <= index < limite:
+            raise IndexError("Índice fora dos limites da matriz.")
+        return range(index, index + 1)
+
+    def _row_values(self, r, cols):
+        """Retorna os valores da linha r nas colunas do range cols."""
+        base = r * self.colunas
+        if cols.step == 1:
+            return self._data[base + cols.start:base + cols.stop]
+        return [self._data[base + j] for j in cols]
+
+    def __getitem__(self, pos):
+        """
+        Acessa uma célula (mat[i, j]) ou uma submatriz por fatias
+        (mat[i, :], mat[:, j], mat[a:b, c:d]). mat[i] equivale a mat[i, :].
+        """
+        if not isinstance(pos, tuple):
+            pos = (pos, slice(None))
+        linha, coluna = pos
+        if not isinstance(linha, slice) and not isinstance(coluna, slice):
+            if not (0 <= linha < self.linhas and 0 <= coluna < self.colunas):
+                raise IndexError("Índice fora dos limites da matriz.")
+            return self._data[linha * self.colunas + coluna]
+        rows = self._range(linha, self.linhas)
+        cols = self._range(coluna, self.colunas)
+        valores = []
+        for r in rows:
+            valores.extend(self._row_values(r, cols))
+        return Matriz._from_flat(len(rows), len(cols), valores, self._typecode, self._usar_numpy)
+
+    def __setitem__(self, pos, valor):
+        """
+        Atribui uma célula (mat[i, j] = v) ou uma região por fatias. Em fatias,
+        o valor pode ser um escalar (preenche a região) ou uma Matriz de mesmas
+        dimensões da região.
+        """
+        if not isinstance(pos, tuple):
+            pos = (pos, slice(None))
+        linha, coluna = pos
+        if not isinstance(linha, slice) and not isinstance(coluna, slice):
+            if not (0 <= linha < self.linhas and 0 <= coluna < self.colunas):
+                raise IndexError("Índice fora dos limites da matriz.")
+            self._data[linha * self.colunas + coluna] = valor
+            return
+        rows = self._range(linha, self.linhas)
+        cols = self._range(coluna, self.colunas)
+        if isinstance(valor, Matriz):
+            if valor.shape != (len(rows), len(cols)):
+                raise ValueError("Dimensões incompatíveis na atribuição por fatia.")
+            fonte = valor._data
+        else:
+            fonte = None
+        for k, r in enumerate(rows):
+            base = r * self.colunas
+            if fonte is None:
+                bloco = [valor] * len(cols)
+            else:
+                bloco = fonte[k * len(cols):(k + 1) * len(cols)]
+            if self._typecode is not None:
+                bloco = array.array(self._typecode, bloco)
+            if cols.step == 1:
+                self._data[base + cols.start:base + cols.stop] = bloco
+            else:
+                for j, x in zip(cols, bloco):
+                    self._data[base + j] = x
+
+    # --- Operações de matriz inteira ---
+    def _elementwise(self, outro, op, op_numpy):
+        """Aplica uma operação elemento a elemento com outra matriz ou um escalar."""
+        if isinstance(outro, Matriz):
+            if outro.shape != self.shape:
+                raise ValueError("As matrizes devem ter as mesmas dimensões.")
+            if self._acelerada() and outro._acelerada():
+                return Matriz._from_numpy(op_numpy(self.to_numpy(), outro.to_numpy()))
+            valores = [op(x, y) for x, y in zip(self._data, outro._data)]
+        else:
+            if self._acelerada():
+                return Matriz._from_numpy(op_numpy(self.to_numpy(), outro))
+            valores = [op(x, outro) for x in self._data]
+        return Matriz._from_flat(self.linhas, self.colunas, valores, self._typecode, self._usar_numpy)
+
+    def __add__(self, outro):
+        return self._elementwise(outro, operator.add, operator.add)
+
+    def __sub__(self, outro):
+        return self._elementwise(outro, operator.sub, operator.sub)
+
+    def __mul__(self, outro):
+        """Produto elemento a elemento (use @ para o produto matricial)."""
+        return self._elementwise(outro, operator.mul, operator.mul)
+
+    def __truediv__(self, outro):
+        return self._elementwise(outro, operator.truediv, operator.truediv)
+
+    __radd__ = __add__
+    __rmul__ = __mul__
+
+    def __neg__(self):
+        return self * -1
+
+    def transpose(self):
+        """Retorna a matriz transposta."""
+        if self._acelerada():
+            return Matriz._from_numpy(self.to_numpy().T)
+        valores = []
+        for j in range(self.colunas):
+            # Cada coluna é uma fatia com passo = número de colunas
+            valores.extend(self._data[j::self.colunas])
+        return Matriz._from_flat(self.colunas, self.linhas, valores, self._typecode, self._usar_numpy)
+
+    @property
+    def T(self):
+        """Atalho para transpose()."""
+        return self.transpose()
+
+    def __matmul__(self, outro):
+        """
+        Produto matricial (self @ outro).
+        Lança um ValueError se as dimensões forem incompatíveis.
+        """
+        if not isinstance(outro, Matriz):
+            return NotImplemented
+        if self.colunas != outro.linhas:
+            raise ValueError("Dimensões incompatíveis para o produto matricial.")
+        if self._acelerada() and outro._acelerada():
+            return Matriz._from_numpy(self.to_numpy() @ outro.to_numpy())
+        n, m, p = self.linhas, self.colunas, outro.colunas
+        linhas_b = [outro._data[k * p:(k + 1) * p] for k in range(m)]
+        valores = []
+        for i in range(n):
+            # Ordem i-k-j: acumula linhas inteiras de B, sem indexar célula a célula
+            acumulada = [0] * p
+            for a_ik, linha_b in zip(self._data[i * m:(i + 1) * m], linhas_b):
+                if a_ik:
+                    acumulada = [x + a_ik * y for x, y in zip(acumulada, linha_b)]
+            valores.extend(acumulada)
+        return Matriz._from_flat(n, p, valores, self._typecode, self._usar_numpy)
+
+    def __eq__(self, outro):
+        if not isinstance(outro, Matriz):
+            return NotImplemented
+        return self.shape == outro.shape and list(self._data) == list(outro._data)
+
+    def tolist(self):
+        """Retorna a matriz como uma lista de listas."""
+        return [list(self._data[i * self.colunas:(i + 1) * self.colunas]) for i in range(self.linhas)]
+
+    def __str__(self):
+        s = ""
+        for i in range(self.linhas):
+            # Constrói a representação da linha a partir de uma fatia do buffer
+            linha = self._data[i * self.colunas:(i + 1) * self.colunas]
+            s += "[" + ", ".join(str(x) for x in linha) + "]\n"
+        return s
+
+# =============================================================================
+# CLASSE MATRIZ ESPARSA (DOK PARA CONSTRUÇÃO, CSR PARA LEITURA)
+# =============================================================================
+
+class MatrizEsparsa:
+    """
+    Matriz esparsa: guarda apenas as células diferentes de zero.
+
+    A construção usa um dicionário de chaves (DOK), {(i, j): valor}, com
+    atribuição O(1). Para varrer linhas e multiplicar por vetores, a matriz é
+    compactada sob demanda no formato CSR (indptr, indices, valores), que só
+    visita as células não nulas. Qualquer atribuição invalida o CSR em cache.
+    """
+    def __init__(self, linhas, colunas):
+        """
+        Construtor da MatrizEsparsa (todas as células começam com zero).
+        :param linhas: Número de linhas.
+        :param colunas: Número de colunas.
+        """
+        if linhas < 0 or colunas < 0:
+            raise ValueError("As dimensões da matriz não podem ser negativas.")
+        self.linhas = linhas
+        self.colunas = colunas
+        self._dok = {}
+        self._csr = None
+
+    @property
+    def shape(self):
+        """Dimensões da matriz como (linhas, colunas)."""
+        return (self.linhas, self.colunas)
+
+    @property
+    def nnz(self):
+        """Número de células não nulas armazenadas."""
+        return len(self._dok)
+
+    def _check(self, linha, coluna):
+        if not (0 <= linha < self.linhas and 0 <= coluna < self.colunas):
+            raise IndexError("Índice fora dos limites da matriz.")
+
+    def __getitem__(self, pos):
+        """Retorna o valor em mat[i, j] (zero se a célula não estiver armazenada)."""
+        linha, coluna = pos
+        self._check(linha, coluna)
+        return self._dok.get((linha, coluna), 0)
+
+    def __setitem__(self, pos, valor):
+        """Atribui mat[i, j] = valor. Atribuir zero remove a célula."""
+        linha, coluna = pos
+        self._check(linha, coluna)
+        if valor == 0:
+            self._dok.pop((linha, coluna), None)
+        else:
+            self._dok[(linha, coluna)] = valor
+        self._csr = None
+
+    def _to_csr(self):
+        """
+        Retorna (e guarda em cache) a forma CSR: indptr[i]:indptr[i+1] delimita,
+        em indices e valores, as células não nulas da linha i.
+        """
+        if self._csr is None:
+            indptr = array.array('q', bytes(8 * (self.linhas + 1)))
+            indices = array.array('q')
+            valores = []
+            for (i, j) in sorted(self._dok):
+                indptr[i + 1] += 1
+                indices.append(j)
+                valores.append(self._dok[(i, j)])
+            for i in range(self.linhas):
+                indptr[i + 1] += indptr[i]
+            self._csr = (indptr, indices, valores)
+        return self._csr
+
+    def iter_row(self, linha):
+        """Gera os pares (coluna, valor) não nulos da linha, em ordem de coluna."""
+        if not 0 <= linha < self.linhas:
+            raise IndexError("Índice fora dos limites da matriz.")
+        indptr, indices, valores = self._to_csr()
+        for k in range(indptr[linha], indptr[linha + 1]):
+            yield indices[k], valores[k]
+
+    def items(self):
+        """Gera as triplas (linha, coluna, valor) não nulas, em ordem por linhas."""
+        indptr, indices, valores = self._to_csr()
+        for i in range(self.linhas):
+            for k in range(indptr[i], indptr[i + 1]):
+                yield i, indices[k], valores[k]
+
+    def matvec(self, vetor):
+        """
+        Produto matriz-vetor usando o CSR; retorna uma lista com 'linhas' valores.
+        Lança um ValueError se o tamanho do vetor for incompatível.
+        """
+        if len(vetor) != self.colunas:
+            raise ValueError("Tamanho do vetor incompatível com o número de colunas.")
+        indptr, indices, valores = self._to_csr()
+        resultado = [0] * self.linhas
+        for i in range(self.linhas):
+            inicio, fim = indptr[i], indptr[i + 1]
+            if inicio != fim:
+                resultado[i] = sum(valores[k] * vetor[indices[k]] for k in range(inicio, fim))
+        return resultado
+
+    def __matmul__(self, vetor):
+        """Atalho para matvec(vetor)."""
+        return self.matvec(vetor)
+
+    def to_dense(self, typecode=None):
+        """Converte para uma Matriz densa."""
+        mat = Matriz(self.linhas, self.colunas, typecode=typecode)
+        for (i, j), valor in self._dok.items():
+            mat[i, j] = valor
+        return mat
+
+    @classmethod
+    def from_dense(cls, mat):
+        """Cria uma MatrizEsparsa com as células não nulas de uma Matriz densa."""
+        esparsa = cls(mat.linhas, mat.colunas)
+        for i in range(mat.linhas):
+            for j, valor in enumerate(mat._row_values(i, range(mat.colunas))):
+                if valor != 0:
+                    esparsa._dok[(i, j)] = valor
+        return esparsa
+
+    def __str__(self):
+        return f"MatrizEsparsa({self.linhas}x{self.colunas}, nnz={self.nnz})"
+
 # =============================================================================
 # BLOCO DE TESTE
 # =============================================================================
@@ -186,7 +932,7 @@ if __name__ == "__main__":
 
     # --- Teste da Classe Array ---
     print("--- Teste: Classe Array ---")
-    arr = Array(3)
+    arr = Array(3, on_resize=lambda antiga, nova: print(f"--- Array redimensionando de {antiga} para {nova} ---"))
     print(f"Array inicial: {arr}, Tamanho: {len(arr)}, Capacidade: {arr._capacity}")
     arr.insert(10)
     arr.insert(20)
@@ -205,38 +951,56 @@ if __name__ == "__main__":
 
     arr[0] = 99
     print(f"Após arr[0] = 99: {arr}")
+
+    arr.insert_many(1, [1, 2, 3])
+    print(f"\nApós insert_many(1, [1, 2, 3]): {arr}")
+    print(f"remove_range(1, 3) removeu: {arr.remove_range(1, 3)} -> {arr}")
+    arr.extend(range(3))
+    print(f"Após extend(range(3)): {arr}")
+    arr[0:2] = ['a', 'b', 'c']
+    print(f"Após arr[0:2] = ['a', 'b', 'c']: {arr}, Fatia arr[1:3]: {arr[1:3]}")
+    print(f"Invertido arr[::-1]: {arr[::-1]}, arr[::-2]: {arr[::-2]}")
+    arr[::-2] = ['v', 'w', 'x', 'y', 'z']
+    print(f"Após arr[::-2] = ['v', 'w', 'x', 'y', 'z']: {arr}")
+    arr[::-1] = arr[:]
+    print(f"Após arr[::-1] = arr[:]: {arr}")
+
+    arr.reserve(20)
+    print(f"\nApós reserve(20): Capacidade: {arr._capacity}")
+    arr.shrink_to_fit()
+    print(f"Após shrink_to_fit(): Tamanho: {len(arr)}, Capacidade: {arr._capacity}")
     print("-" * 40)
 
-    # --- Teste da Classe Matriz usando a Classe Array ---
-    print("\n--- Teste: Classe Matriz usando a Classe Array ---")
-
-    class Matriz:
-        def __init__(self, linhas, colunas):
-            self.linhas = linhas
-            self.colunas = colunas
-            # Usa a classe Array desenvolvida para armazenar as linhas
-            self._data = Array(linhas)
-            for i in range(linhas):
-                # Cada linha é outro objeto Array
-                self._data.insert(Array(colunas))
-                for j in range(colunas):
-                    self._data[i].insert(0) # Inicializa com zeros
-
-        def __getitem__(self, pos):
-            linha, coluna = pos
-            return self._data[linha][coluna]
-
-        def __setitem__(self, pos, valor):
-            linha, coluna = pos
-            self._data[linha][coluna] = valor
-
-        def __str__(self):
-            s = ""
-            for i in range(self.linhas):
-                # Constrói a representação da linha
-                linha_str = [str(self._data[i][j]) for j in range(self.colunas)]
-                s += "[" + ", ".join(linha_str) + "]\n"
-            return s
+    # --- Teste do Array tipado (buffer contíguo) ---
+    print("\n--- Teste: Array tipado (typecode='d') ---")
+    serie = Array(4, typecode='d')
+    serie.extend([1.5, 2.5, 3.5])
+    serie.insert(0.5, index=0)
+    serie.insert(4.5)
+    print(f"Série: {serie}, Capacidade: {serie._capacity}")
+    visao = serie.view()
+    print(f"memoryview: formato={visao.format}, itens={visao.tolist()}, bytes={visao.nbytes}")
+    print(f"Removido do índice 1: {serie.remove(1)} -> {serie}, Invertida: {serie[::-1]}")
+    print("-" * 40)
+
+    # --- Teste da Classe ArrayGapBuffer ---
+    print("\n--- Teste: Classe ArrayGapBuffer ---")
+    gap = ArrayGapBuffer(4)
+    for letra in "abcdef":
+        gap.insert(letra)
+    print(f"Após inserir 'abcdef': {gap}")
+    for i, letra in enumerate("XYZ"):
+        gap.insert(letra, index=2 + i)   # edições próximas: a lacuna já está lá
+    print(f"Após inserir 'XYZ' a partir do índice 2: {gap}")
+    print(f"Removido do índice 3: {gap.remove(3)} -> {gap}")
+    gap[0] = 'A'
+    print(f"Após gap[0] = 'A': {gap}, gap[4] = {gap[4]}")
+    gap[1:3] = ['1', '2', '3', '4']
+    print(f"Após gap[1:3] = ['1', '2', '3', '4']: {gap}, Fatia gap[2:5]: {gap[2:5]}, gap[::-2]: {gap[::-2]}")
+    print("-" * 40)
+
+    # --- Teste da Classe Matriz ---
+    print("\n--- Teste: Classe Matriz (buffer contíguo) ---")
 
     mat = Matriz(3, 4)
     print("Matriz 3x4 Inicializada:")
@@ -247,4 +1011,29 @@ if __name__ == "__main__":
     print("Matriz após atribuições (mat[1,2]=5, mat[0,0]=9):")
     print(mat)
     print(f"Valor em mat[1,2]: {mat[1,2]}")
+    print(f"Linha 1 (mat[1, :]):\n{mat[1, :]}")
+    print(f"Coluna 2 (mat[:, 2]):\n{mat[:, 2]}")
+
+    a = Matriz.from_rows([[1, 2], [3, 4]])
+    b = Matriz.from_rows([[5, 6], [7, 8]])
+    print(f"A + B:\n{a + b}")
+    print(f"A * 2:\n{a * 2}")
+    print(f"Transposta de A:\n{a.transpose()}")
+    print(f"A @ B:\n{a @ b}")
+    tipada = Matriz.from_rows([[1.0, 2.0], [3.0, 4.0]], typecode='d')
+    print(f"Matriz tipada A @ A (NumPy: {'sim' if np is not None else 'não'}):\n{tipada @ tipada}")
+    print("-" * 40)
+
+    # --- Teste da Classe MatrizEsparsa ---
+    print("\n--- Teste: Classe MatrizEsparsa ---")
+    adj = MatrizEsparsa(100_000, 100_000)
+    adj[0, 1] = 1
+    adj[0, 99_999] = 1
+    adj[50_000, 0] = 2
+    print(f"{adj}, adj[0, 1] = {adj[0, 1]}, adj[1, 0] = {adj[1, 0]}")
+    print(f"Vizinhos da linha 0: {list(adj.iter_row(0))}")
+    esparsa = MatrizEsparsa.from_dense(mat)
+    print(f"Esparsa a partir da matriz 3x4: {esparsa}, itens: {list(esparsa.items())}")
+    print(f"Produto por [1, 1, 1, 1]: {esparsa @ [1, 1, 1, 1]}")
+    print(f"De volta para densa:\n{esparsa.to_dense()}")
     print("-" * 40)
\ No newline at end of file
@@ -54,6 +54,8 @@ class EstruturaLinear(ABC):
 
 class Node:
     """Nó para a Lista Simplesmente Encadeada."""
+    __slots__ = ('data', 'next')
+
     def __init__(self, data):
         self.data = data
         self.next = None
@@ -63,6 +65,8 @@ class Node:
 
 class DoubleNode(Node):
     """Nó para a Lista Duplamente Encadeada."""
+    __slots__ = ('prev',)
+
     def __init__(self, data):
         super().__init__(data)
         self.prev = None
@@ -82,14 +86,14 @@ class ListaSimplesmenteEncadeada(EstruturaLinear):
     def __init__(self, iterable=None):
         """
         Construtor da Lista.
-        Pode ser inicializada a partir de um objeto iterável (como uma lista Python).
+        Pode ser inicializada a partir de qualquer iterável (lista, gerador, arquivo...),
+        consumido item a item, sem precisar de uma cópia em memória.
         """
         self._head = None
+        self._tail = None
         self._size = 0
-        if iterable:
-            # Inserimos na ordem inversa para que a lista final mantenha a ordem do iterável
-            for item in reversed(iterable):
-                self.push(item)
+        if iterable is not None:
+            self.extend(iterable)
 
     def __len__(self):
         """Retorna o número de nós na lista."""
@@ -100,8 +104,28 @@ class ListaSimplesmenteEncadeada(EstruturaLinear):
         new_node = Node(item)
         new_node.next = self._head
         self._head = new_node
+        if self._tail is None:
+            self._tail = new_node
+        self._size += 1
+
+    def push_back(self, item):
+        """Insere um item no fim da lista (operação O(1), via ponteiro de cauda)."""
+        new_node = Node(item)
+        if self._tail is None:
+            self._head = new_node
+        else:
+            self._tail.next = new_node
+        self._tail = new_node
         self._size += 1
 
+    def extend(self, iterable):
+        """
+        Insere todos os itens do iterável no fim da lista, na mesma ordem.
+        O iterável é consumido de forma preguiçosa (um item por vez).
+        """
+        for item in iterable:
+            self.push_back(item)
+
     def pop(self):
         """
         Remove e retorna o item do início da lista (operação O(1)).
@@ -111,6 +135,8 @@ class ListaSimplesmenteEncadeada(EstruturaLinear):
             raise IndexError("Remoção de uma lista vazia (underflow).")
         item_removido = self._head.data
         self._head = self._head.next
+        if self._head is None:
+            self._tail = None
         self._size -= 1
         return item_removido
 
@@ -127,6 +153,27 @@ class ListaSimplesmenteEncadeada(EstruturaLinear):
             current = current.next
         return current.data
 
+    def __iter__(self):
+        """Percorre os itens do início ao fim (gerador)."""
+        current = self._head
+        while current:
+            yield current.data
+            current = current.next
+
+    def __reversed__(self):
+        """
+        Percorre os itens do fim ao início (gerador).
+        Como os nós só apontam para o próximo, guarda as referências dos nós
+        em uma lista auxiliar antes de percorrê-la ao contrário (O(n) de memória).
+        """
+        nodes = []
+        current = self._head
+        while current:
+            nodes.append(current)
+            current = current.next
+        for node in reversed(nodes):
+            yield node.data
+
     # --- Implementação dos métodos abstratos ---
     def insert(self, item, **kwargs):
         """Implementação genérica de inserção. Por padrão, insere no início."""
@@ -163,9 +210,12 @@ class Pilha(EstruturaLinear):
     Implementação de uma Pilha (Stack) usando composição com
     ListaSimplesmenteEncadeada. A lógica é LIFO (Last-In, First-Out).
     """
-    def __init__(self):
-        """Construtor da Pilha. Cria uma lista interna para armazenar os dados."""
-        self._lista = ListaSimplesmenteEncadeada()
+    def __init__(self, lista=None):
+        """
+        Construtor da Pilha. Cria uma lista interna para armazenar os dados,
+        ou usa a lista informada (qualquer lista com push/pop/find_at).
+        """
+        self._lista = lista if lista is not None else ListaSimplesmenteEncadeada()
 
     def __len__(self):
         """Retorna o número de itens na pilha."""
@@ -226,6 +276,10 @@ if __name__ == "__main__":
     removido = lista_s.pop()
     print(f"Pop (item removido: {removido}): {lista_s}")
     print(f"Item no índice 1: {lista_s.find_at(1)}")
+    lista_s.push_back(40)
+    lista_s.extend(x * 10 for x in range(5, 7))   # gerador consumido sob demanda
+    print(f"Após push_back(40) e extend(gerador): {lista_s}")
+    print(f"Iteração reversa: {list(reversed(lista_s))}")
     print("-" * 40)
 
     # --- Teste da Classe Pilha ---
@@ -5,13 +5,37 @@ Parte 5 e 6: Classe ListaDuplamenteEncadeada e Classe Fila
 
 Este arquivo contém:
 - As classes base e as implementações anteriores (Lista Simples, Pilha).
-- A implementação da Classe ListaDuplamenteEncadeada.
+- A implementação da Classe ListaDuplamenteEncadeada (e de suas variantes compacta e desenrolada).
+- A implementação da ListaDeSaltosIndexada, com acesso posicional em O(log n).
+- Um deque circular (ring buffer) pré-alocado, base da FilaCircular de capacidade fixa
+  e da FilaEmDisco, que guarda o meio de filas muito grandes em arquivos.
 - A implementação da Classe Fila, que utiliza a Lista Dupla por composição.
-- A resolução dos problemas da "Fila de Prioridades" e "Fila do Bandejão".
+- Versões da Fila e da Pilha seguras para várias threads, com espera, capacidade e lotes,
+  uma Fila para asyncio com controle de fluxo e uma fila em memória compartilhada entre processos.
+- A resolução dos problemas da "Fila de Prioridades" (lista ordenada, heap ou baldes) e "Fila do Bandejão".
+- Uma versão do bandejão com vários balcões e uma simulação de eventos discretos, em tempo virtual,
+  com varreduras de parâmetros em paralelo.
 """
 
 from abc import ABC, abstractmethod
+import array
+import asyncio
+import concurrent.futures
+import csv
 import datetime
+import itertools
+import json
+import math
+import multiprocessing
+import multiprocessing.shared_memory
+import os
+import pickle
+import random
+import struct
+import tempfile
+import threading
+import time
+import weakref
 
 # =============================================================================
 # CLASSE BASE ABSTRATA (Das partes anteriores)
@@ -56,6 +80,8 @@ class EstruturaLinear(ABC):
 
 class Node:
     """Nó para a Lista Simplesmente Encadeada."""
+    __slots__ = ('data', 'next')
+
     def __init__(self, data):
         self.data = data
         self.next = None
@@ -64,10 +90,16 @@ class Node:
         return f"Node(data={self.data})"
 
 class DoubleNode(Node):
-    """Nó para a Lista Duplamente Encadeada."""
+    """
+    Nó para a Lista Duplamente Encadeada.
+    owner é a marca da lista que contém o nó (None depois de removido).
+    """
+    __slots__ = ('prev', 'owner')
+
     def __init__(self, data):
         super().__init__(data)
         self.prev = None
+        self.owner = None
         
     def __repr__(self):
         return f"DoubleNode(data={self.data})"
@@ -79,20 +111,30 @@ class DoubleNode(Node):
 class ListaSimplesmenteEncadeada(EstruturaLinear):
     def __init__(self, iterable=None):
         self._head = None
+        self._tail = None
         self._size = 0
-        if iterable:
-            for item in reversed(iterable):
-                self.push(item)
+        if iterable is not None:
+            self.extend(iterable)
     def __len__(self): return self._size
     def push(self, item):
         new_node = Node(item)
         new_node.next = self._head
         self._head = new_node
+        if self._tail is None: self._tail = new_node
+        self._size += 1
+    def push_back(self, item):
+        new_node = Node(item)
+        if self._tail is None: self._head = new_node
+        else: self._tail.next = new_node
+        self._tail = new_node
         self._size += 1
+    def extend(self, iterable):
+        for item in iterable: self.push_back(item)
     def pop(self):
         if self.is_empty(): raise IndexError("Remoção de uma lista vazia (underflow).")
         item_removido = self._head.data
         self._head = self._head.next
+        if self._head is None: self._tail = None
         self._size -= 1
         return item_removido
     def find_at(self, index):
@@ -100,6 +142,18 @@ class ListaSimplesmenteEncadeada(EstruturaLinear):
         current = self._head
         for _ in range(index): current = current.next
         return current.data
+    def __iter__(self):
+        current = self._head
+        while current:
+            yield current.data
+            current = current.next
+    def __reversed__(self):
+        nodes = []
+        current = self._head
+        while current:
+            nodes.append(current)
+            current = current.next
+        for node in reversed(nodes): yield node.data
     def insert(self, item, **kwargs): self.push(item)
     def remove(self, **kwargs): return self.pop()
     def find(self, key, **kwargs):
@@ -121,8 +175,9 @@ class ListaSimplesmenteEncadeada(EstruturaLinear):
 # =============================================================================
 
 class Pilha(EstruturaLinear):
-    def __init__(self): self._lista = ListaSimplesmenteEncadeada()
+    def __init__(self, lista=None): self._lista = lista if lista is not None else ListaSimplesmenteEncadeada()
     def __len__(self): return len(self._lista)
+    def is_full(self): return self._lista.is_full()
     def push(self, item): self._lista.push(item)
     def pop(self):
         if self.is_empty(): raise IndexError("Pilha vazia (Stack underflow).")
@@ -140,11 +195,21 @@ class Pilha(EstruturaLinear):
 # =============================================================================
 
 class ListaDuplamenteEncadeada(EstruturaLinear):
-    """Implementação de uma Lista Duplamente Encadeada."""
+    """
+    Implementação de uma Lista Duplamente Encadeada.
+    Guarda um "dedo" (_finger): o último nó acessado por posição e seu índice,
+    para que acessos posicionais próximos custem O(distância).
+
+    Cada nó guarda em owner a marca desta lista (um objeto só dela, e não a
+    própria lista, para não criar ciclos de referência), o que permite a
+    remove_node recusar em O(1) nós de outra lista ou já removidos.
+    """
     def __init__(self, iterable=None):
         self._head = None
         self._tail = None
         self._size = 0
+        self._finger = None
+        self._owner = object()
         if iterable:
             for item in iterable:
                 self.push_back(item)
@@ -153,8 +218,9 @@ class ListaDuplamenteEncadeada(EstruturaLinear):
         return self._size
 
     def push(self, item):
-        """Insere um item no início da lista (O(1))."""
+        """Insere um item no início da lista (O(1)) e retorna o nó criado."""
         new_node = DoubleNode(item)
+        new_node.owner = self._owner
         if self.is_empty():
             self._head = self._tail = new_node
         else:
@@ -162,10 +228,15 @@ class ListaDuplamenteEncadeada(EstruturaLinear):
             self._head.prev = new_node
             self._head = new_node
         self._size += 1
+        if self._finger is not None:
+            # Todos os índices avançam uma posição
+            self._finger = (self._finger[0], self._finger[1] + 1)
+        return new_node
 
     def push_back(self, item):
-        """Insere um item no fim da lista (O(1))."""
+        """Insere um item no fim da lista (O(1)) e retorna o nó criado."""
         new_node = DoubleNode(item)
+        new_node.owner = self._owner
         if self.is_empty():
             self._head = self._tail = new_node
         else:
@@ -173,37 +244,76 @@ class ListaDuplamenteEncadeada(EstruturaLinear):
             self._tail.next = new_node
             self._tail = new_node
         self._size += 1
+        return new_node
+
+    @staticmethod
+    def _detach(node):
+        """
+        Marca um nó removido (sem dono), para detectar remoções repetidas.
+        Os ponteiros são zerados, e não apontados para o próprio nó, para não
+        criar um ciclo que só o coletor de ciclos liberaria.
+        """
+        node.next = node.prev = node.owner = None
 
     def pop(self):
         """Remove e retorna o item do início da lista (O(1))."""
         if self.is_empty(): raise IndexError("Remoção de uma lista vazia (underflow).")
-        item_removido = self._head.data
+        node = self._head
+        if self._finger is not None:
+            if self._finger[0] is node: self._finger = None
+            else: self._finger = (self._finger[0], self._finger[1] - 1)
         if self._size == 1:
             self._head = self._tail = None
         else:
-            self._head = self._head.next
+            self._head = node.next
             self._head.prev = None
         self._size -= 1
-        return item_removido
+        self._detach(node)
+        return node.data
 
     def pop_back(self):
         """Remove e retorna o item do fim da lista (O(1))."""
         if self.is_empty(): raise IndexError("Remoção de uma lista vazia (underflow).")
-        item_removido = self._tail.data
+        node = self._tail
+        if self._finger is not None and self._finger[0] is node:
+            self._finger = None
         if self._size == 1:
             self._head = self._tail = None
         else:
-            self._tail = self._tail.prev
+            self._tail = node.prev
             self._tail.next = None
         self._size -= 1
-        return item_removido
+        self._detach(node)
+        return node.data
+
+    def _node_at(self, index):
+        """
+        Retorna o nó na posição index, partindo do ponto mais próximo entre
+        a cabeça, a cauda e o dedo, que é então movido para esse nó.
+        """
+        if not 0 <= index < self._size: raise IndexError("Índice fora dos limites.")
+        if index <= self._size - 1 - index:
+            node, pos = self._head, 0
+        else:
+            node, pos = self._tail, self._size - 1
+        if self._finger is not None and abs(index - self._finger[1]) < abs(index - pos):
+            node, pos = self._finger
+        while pos < index:
+            node = node.next
+            pos += 1
+        while pos > index:
+            node = node.prev
+            pos -= 1
+        self._finger = (node, index)
+        return node
 
     def find_at(self, index):
         """Consulta (sem remover) o item na i-ésima posição."""
-        if not 0 <= index < self._size: raise IndexError("Índice fora dos limites.")
-        current = self._head
-        for _ in range(index): current = current.next
-        return current.data
+        return self._node_at(index).data
+
+    def set_at(self, index, item):
+        """Substitui o item na i-ésima posição."""
+        self._node_at(index).data = item
 
     def swap(self, index1, index2):
         """Troca os dados de dois nós em posições sucessivas."""
@@ -211,21 +321,170 @@ class ListaDuplamenteEncadeada(EstruturaLinear):
         if index2 != index1 + 1 or not (0 <= index1 < self._size and 0 <= index2 < self._size):
             raise ValueError("A troca só pode ocorrer entre posições sucessivas e válidas.")
         
-        node1 = self._head
-        for _ in range(index1): node1 = node1.next
+        node1 = self._node_at(index1)
         node2 = node1.next
         
         node1.data, node2.data = node2.data, node1.data
 
-    def bubble_sort(self, key=lambda x: x):
-        """Ordena a lista usando o algoritmo Bubble Sort, com base numa chave."""
+    def _decorate(self, key):
+        """
+        Guarda a chave de cada nó no próprio campo prev (calculada uma única vez).
+        Durante a ordenação só os ponteiros next são usados; prev é refeito depois.
+        Todas as chaves são calculadas antes de qualquer escrita, então se key()
+        falhar a lista fica intacta. Retorna os nós na ordem original.
+        """
+        nodes = []
+        current = self._head
+        while current:
+            nodes.append(current)
+            current = current.next
+        keys = [node.data for node in nodes] if key is None else [key(node.data) for node in nodes]
+        for node, chave in zip(nodes, keys):
+            node.prev = chave
+        return nodes
+
+    def _relink(self, nodes):
+        """Religa os nós na ordem dada e refaz prev e a cauda (desfaz uma ordenação interrompida)."""
+        for node, seguinte in zip(nodes, nodes[1:]):
+            node.next = seguinte
+        nodes[-1].next = None
+        self._head = nodes[0]
+        self._undecorate()
+
+    def _undecorate(self):
+        """Refaz os ponteiros prev e a cauda a partir dos ponteiros next."""
+        prev = None
+        current = self._head
+        while current:
+            current.prev = prev
+            prev = current
+            current = current.next
+        self._tail = prev
+        self._finger = None
+
+    @staticmethod
+    def _merge_runs(a, b, reverse):
+        """
+        Intercala duas sequências de nós já ordenadas (ligadas por next, chaves em prev).
+        Só pega da segunda quando ela vem estritamente antes, o que mantém a estabilidade.
+        """
+        if (b.prev > a.prev) if reverse else (b.prev < a.prev):
+            head, b = b, b.next
+        else:
+            head, a = a, a.next
+        tail = head
+        while a is not None and b is not None:
+            if (b.prev > a.prev) if reverse else (b.prev < a.prev):
+                tail.next, tail, b = b, b, b.next
+            else:
+                tail.next, tail, a = a, a, a.next
+        tail.next = a if a is not None else b
+        return head
+
+    def sort(self, key=None, reverse=False):
+        """
+        Ordena a lista de forma estável com um merge sort natural bottom-up (O(n log n)).
+        Os nós são religados (os dados não são trocados) e key é chamada uma vez por item.
+        """
         if self._size < 2: return
-        for i in range(self._size):
+        nodes = self._decorate(key)
+        try:
+            # Separa a lista em sequências já ordenadas (runs naturais)
+            runs = []
             current = self._head
-            for j in range(self._size - i - 1):
-                if key(current.data) > key(current.next.data):
-                    current.data, current.next.data = current.next.data, current.data
-                current = current.next
+            while current:
+                runs.append(current)
+                while current.next is not None and not (
+                        (current.next.prev > current.prev) if reverse else (current.next.prev < current.prev)):
+                    current = current.next
+                current.next, current = None, current.next
+            # Intercala os runs dois a dois até sobrar um só
+            while len(runs) > 1:
+                merged = [self._merge_runs(runs[i], runs[i + 1], reverse) for i in range(0, len(runs) - 1, 2)]
+                if len(runs) % 2: merged.append(runs[-1])
+                runs = merged
+        except BaseException:
+            # Uma comparação falhou no meio da religação: volta à ordem original
+            self._relink(nodes)
+            raise
+        self._head = runs[0]
+        self._undecorate()
+
+    def merge(self, other, key=None, reverse=False):
+        """
+        Intercala em O(n + m) outra lista já ordenada (com os mesmos key/reverse)
+        nesta lista, também ordenada. Os nós de other são religados aqui, sem
+        alocar novos nós, e other fica vazia.
+        """
+        if other is self or other.is_empty(): return
+        if self.is_empty():
+            self._head, self._tail, self._size = other._head, other._tail, other._size
+            # Os nós mudam de lista sem serem visitados: as marcas de dono são trocadas
+            self._owner, other._owner = other._owner, self._owner
+        else:
+            nodes = self._decorate(key)
+            other_nodes = None
+            try:
+                other_nodes = other._decorate(key)
+                merged = self._merge_runs(self._head, other._head, reverse)
+            except BaseException:
+                # key() ou uma comparação falhou: as duas listas voltam ao que eram
+                self._relink(nodes)
+                if other_nodes is not None: other._relink(other_nodes)
+                raise
+            for node in other_nodes:
+                node.owner = self._owner
+            self._head = merged
+            self._size += other._size
+        self._undecorate()
+        other._head = other._tail = other._finger = None
+        other._size = 0
+
+    def bubble_sort(self, key=lambda x: x):
+        """Mantido por compatibilidade: ordena com base numa chave usando sort()."""
+        self.sort(key=key)
+
+    def remove_node(self, node):
+        """
+        Desliga da lista, em O(1), um nó desta lista (ex: o retornado por push_back).
+        Retorna False se o nó já tinha sido removido ou pertence a outra lista.
+        """
+        if node.owner is not self._owner: return False
+        self._finger = None
+        if node.prev: node.prev.next = node.next
+        else: self._head = node.next
+
+        if node.next: node.next.prev = node.prev
+        else: self._tail = node.prev
+
+        self._size -= 1
+        self._detach(node)
+        return True
+
+    def peek_node(self):
+        """Retorna o primeiro nó (o handle do item do início), sem removê-lo."""
+        if self.is_empty(): raise IndexError("Lista vazia.")
+        return self._head
+
+    def find_node(self, item):
+        """Retorna o primeiro nó cujo dado é igual ao item, ou None."""
+        current = self._head
+        while current:
+            if current.data == item:
+                return current
+            current = current.next
+        return None
+
+    def remove_first(self, item):
+        """Remove o primeiro nó cujo dado é igual ao item. Retorna True se encontrou."""
+        node = self.find_node(item)
+        return self.remove_node(node) if node is not None else False
+
+    def __iter__(self):
+        current = self._head
+        while current:
+            yield current.data
+            current = current.next
 
     # --- Implementação dos métodos abstratos ---
     def insert(self, item, **kwargs): self.push_back(item)
@@ -245,184 +504,2866 @@ class ListaDuplamenteEncadeada(EstruturaLinear):
         return f"ListaDupla: [{' <-> '.join(items)}]"
 
 # =============================================================================
-# CLASSE FILA (QUEUE) - (NOVA - Parte 6)
+# CLASSE LISTA DUPLAMENTE ENCADEADA COMPACTA (ARRAYS PARALELOS)
 # =============================================================================
 
-class Fila(EstruturaLinear):
+class ListaDuplamenteEncadeadaCompacta(EstruturaLinear):
     """
-    Implementação de uma Fila (Queue) usando composição com
-    ListaDuplamenteEncadeada. A lógica é FIFO (First-In, First-Out).
+    Lista duplamente encadeada sem objetos de nó: os dados e os ponteiros
+    ficam em arrays paralelos (_data, _next, _prev), e os "ponteiros" são
+    índices inteiros nesses arrays (-1 representa None).
+
+    Posições liberadas por remoções entram em uma lista livre interna
+    (encadeada pelo próprio _next) e são reaproveitadas nas próximas inserções.
+    Mantém a API push/push_back/pop/pop_back das listas encadeadas.
     """
-    def __init__(self):
-        self._lista = ListaDuplamenteEncadeada()
+    NIL = -1
+
+    def __init__(self, iterable=None):
+        self._data = []
+        self._next = array.array('q')
+        self._prev = array.array('q')
+        self._head = self.NIL
+        self._tail = self.NIL
+        self._free = self.NIL
+        self._size = 0
+        if iterable:
+            for item in iterable:
+                self.push_back(item)
 
     def __len__(self):
-        return len(self._lista)
+        return self._size
 
-    def enqueue(self, item):
-        """Adiciona um item ao final da fila (O(1))."""
-        self._lista.push_back(item)
+    def _new_slot(self, item):
+        """Obtém uma posição livre (reaproveitada ou nova) e guarda o item nela."""
+        if self._free != self.NIL:
+            slot = self._free
+            self._free = self._next[slot]
+            self._data[slot] = item
+        else:
+            slot = len(self._data)
+            self._data.append(item)
+            self._next.append(self.NIL)
+            self._prev.append(self.NIL)
+        return slot
 
-    def dequeue(self):
-        """Remove e retorna o item do início da fila (O(1))."""
-        if self.is_empty(): raise IndexError("Fila vazia (Queue underflow).")
-        return self._lista.pop()
+    def _release(self, slot):
+        """Devolve a posição à lista livre e retorna o item que estava nela."""
+        item = self._data[slot]
+        self._data[slot] = None
+        self._prev[slot] = self.NIL
+        self._next[slot] = self._free
+        self._free = slot
+        return item
 
-    def peek(self):
-        """Retorna o item do início da fila sem removê-lo."""
-        if self.is_empty(): raise IndexError("Fila vazia.")
-        return self._lista.find_at(0)
+    def push(self, item):
+        """Insere um item no início da lista (O(1))."""
+        slot = self._new_slot(item)
+        self._prev[slot] = self.NIL
+        self._next[slot] = self._head
+        if self._head == self.NIL:
+            self._tail = slot
+        else:
+            self._prev[self._head] = slot
+        self._head = slot
+        self._size += 1
 
-    def remove_item(self, item_to_remove):
-        """Remove um item específico da fila (para desistências)."""
-        current = self._lista._head
-        while current:
-            if current.data == item_to_remove:
-                if current.prev: current.prev.next = current.next
-                else: self._lista._head = current.next
-                
-                if current.next: current.next.prev = current.prev
-                else: self._lista._tail = current.prev
-                
-                self._lista._size -= 1
-                return True
-            current = current.next
-        return False
+    def push_back(self, item):
+        """Insere um item no fim da lista (O(1))."""
+        slot = self._new_slot(item)
+        self._next[slot] = self.NIL
+        self._prev[slot] = self._tail
+        if self._tail == self.NIL:
+            self._head = slot
+        else:
+            self._next[self._tail] = slot
+        self._tail = slot
+        self._size += 1
+
+    def pop(self):
+        """Remove e retorna o item do início da lista (O(1))."""
+        if self.is_empty(): raise IndexError("Remoção de uma lista vazia (underflow).")
+        slot = self._head
+        self._head = self._next[slot]
+        if self._head == self.NIL:
+            self._tail = self.NIL
+        else:
+            self._prev[self._head] = self.NIL
+        self._size -= 1
+        return self._release(slot)
+
+    def pop_back(self):
+        """Remove e retorna o item do fim da lista (O(1))."""
+        if self.is_empty(): raise IndexError("Remoção de uma lista vazia (underflow).")
+        slot = self._tail
+        self._tail = self._prev[slot]
+        if self._tail == self.NIL:
+            self._head = self.NIL
+        else:
+            self._next[self._tail] = self.NIL
+        self._size -= 1
+        return self._release(slot)
+
+    def find_at(self, index):
+        """Consulta (sem remover) o item na i-ésima posição."""
+        if not 0 <= index < self._size: raise IndexError("Índice fora dos limites.")
+        slot = self._head
+        for _ in range(index): slot = self._next[slot]
+        return self._data[slot]
 
-    # --- Implementação dos métodos abstratos ---
-    def insert(self, item, **kwargs): self.enqueue(item)
-    def remove(self, **kwargs): return self.dequeue()
-    def find(self, **kwargs): return self.peek()
     def __iter__(self):
-        current = self._lista._head
-        while current:
-            yield current.data
-            current = current.next
-    def __str__(self): return f"Fila: {str(self._lista)}"
+        slot = self._head
+        while slot != self.NIL:
+            yield self._data[slot]
+            slot = self._next[slot]
+
+    # --- Implementação dos métodos abstratos ---
+    def insert(self, item, **kwargs): self.push_back(item)
+    def remove(self, **kwargs): return self.pop_back()
+    def find(self, key_value, **kwargs):
+        for item in self:
+            if item == key_value: return item
+        raise ValueError(f"Chave '{key_value}' não encontrada.")
+    def __str__(self):
+        return f"ListaCompacta: [{' <-> '.join(str(item) for item in self)}]"
 
 # =============================================================================
-# RESOLUÇÃO DOS PROBLEMAS
+# CLASSE LISTA DESENROLADA (UNROLLED LINKED LIST)
 # =============================================================================
 
-class FilaDePrioridades(ListaDuplamenteEncadeada):
+class BlocoNode:
+    """Nó da Lista Desenrolada: guarda um bloco com vários itens consecutivos."""
+    __slots__ = ('itens', 'next', 'prev')
+
+    def __init__(self, itens=None):
+        self.itens = itens if itens is not None else []
+        self.next = None
+        self.prev = None
+
+    def __repr__(self):
+        return f"BlocoNode(itens={self.itens})"
+
+class ListaDesenrolada(EstruturaLinear):
     """
-    Implementação de uma Fila de Prioridades.
-    Herda da Lista Duplamente Encadeada e insere os itens de forma ordenada.
+    Lista duplamente encadeada de blocos (unrolled linked list).
+    Cada nó guarda até 'tamanho_bloco' itens em uma lista Python, então
+    percorrer a lista segue um ponteiro por bloco, e não um por item.
+
+    push/push_back/pop/pop_back são O(1); inserções e remoções no meio
+    dividem blocos cheios e juntam blocos vizinhos pouco ocupados.
+    Pode ser usada como armazenamento interno da Fila e da Pilha.
     """
-    def __init__(self, key=lambda x: x['prioridade']):
-        super().__init__()
-        self.key = key
+    def __init__(self, iterable=None, tamanho_bloco=64):
+        if tamanho_bloco < 2:
+            raise ValueError("O tamanho do bloco deve ser pelo menos 2.")
+        self._tamanho_bloco = tamanho_bloco
+        self._head = None
+        self._tail = None
+        self._size = 0
+        if iterable is not None:
+            for item in iterable:
+                self.push_back(item)
 
-    def insert_ordered(self, item):
-        """Insere um item mantendo a ordem de prioridade (menor para maior)."""
-        if self.is_empty() or self.key(item) < self.key(self._head.data):
-            self.push(item)
-        elif self.key(item) >= self.key(self._tail.data):
-            self.push_back(item)
+    def __len__(self):
+        return self._size
+
+    # --- Manipulação de blocos ---
+    def _link_after(self, block, new_block):
+        """Encadeia new_block logo após block (ou no início, se block for None)."""
+        if block is None:
+            new_block.next = self._head
+            if self._head: self._head.prev = new_block
+            else: self._tail = new_block
+            self._head = new_block
         else:
-            new_node = DoubleNode(item)
-            current = self._head
-            while self.key(current.data) < self.key(item):
-                current = current.next
-            
-            new_node.next = current
-            new_node.prev = current.prev
-            current.prev.next = new_node
-            current.prev = new_node
-            self._size += 1
+            new_block.prev = block
+            new_block.next = block.next
+            if block.next: block.next.prev = new_block
+            else: self._tail = new_block
+            block.next = new_block
 
-    def get_highest_priority(self):
-        """Retorna o item de maior prioridade (o primeiro da lista)."""
-        return self.pop()
+    def _unlink(self, block):
+        """Remove um bloco do encadeamento."""
+        if block.prev: block.prev.next = block.next
+        else: self._head = block.next
+        if block.next: block.next.prev = block.prev
+        else: self._tail = block.prev
+        block.next = block.prev = None
 
-class FilaBandejao:
-    """Simulação do problema da fila do bandejão."""
-    class Usuario:
-        def __init__(self, nome, id_usuario):
-            self.nome = nome
-            self.id = id_usuario
-            self.hora_estimada_atendimento = None
-        def __repr__(self): return f"Usuario({self.nome}, ID:{self.id})"
+    def _split(self, block):
+        """Divide um bloco cheio ao meio, criando um novo bloco logo após ele."""
+        metade = len(block.itens) // 2
+        self._link_after(block, BlocoNode(block.itens[metade:]))
+        del block.itens[metade:]
 
-    def __init__(self, tempo_medio_atendimento_min=2):
-        self.fila_de_pedidos = Fila()
-        self.tempo_medio_atendimento = datetime.timedelta(minutes=tempo_medio_atendimento_min)
-        self.proximo_id = 1
+    def _merge(self, block):
+        """
+        Junta um bloco que ficou com menos da metade da capacidade
+        com um vizinho, se os dois couberem em um único bloco.
+        """
+        if len(block.itens) >= self._tamanho_bloco // 2:
+            return
+        vizinho = block.next
+        if vizinho and len(block.itens) + len(vizinho.itens) <= self._tamanho_bloco:
+            block.itens.extend(vizinho.itens)
+            self._unlink(vizinho)
+            return
+        vizinho = block.prev
+        if vizinho and len(block.itens) + len(vizinho.itens) <= self._tamanho_bloco:
+            vizinho.itens.extend(block.itens)
+            self._unlink(block)
 
-    def estimar_tempo_espera(self):
-        return len(self.fila_de_pedidos) * self.tempo_medio_atendimento
+    def _after_removal(self, block):
+        """Descarta o bloco se ele ficou vazio; senão, tenta juntá-lo a um vizinho."""
+        if not block.itens:
+            self._unlink(block)
+        else:
+            self._merge(block)
 
-    def entrar_na_fila(self, nome_usuario):
-        agora = datetime.datetime.now()
-        tempo_espera = self.estimar_tempo_espera() + self.tempo_medio_atendimento
-        usuario = self.Usuario(nome_usuario, self.proximo_id)
-        self.proximo_id += 1
-        usuario.hora_estimada_atendimento = agora + tempo_espera
-        self.fila_de_pedidos.enqueue(usuario)
-        print(f"\n>> {usuario.nome} entrou na fila. Posição: {len(self.fila_de_pedidos)}, Retirada às: {usuario.hora_estimada_atendimento.strftime('%H:%M:%S')}")
-        return usuario
+    def _locate(self, index):
+        """Retorna (bloco, deslocamento) do item na posição index, partindo da ponta mais próxima."""
+        if index < self._size // 2:
+            block = self._head
+            while index >= len(block.itens):
+                index -= len(block.itens)
+                block = block.next
+            return block, index
+        block = self._tail
+        index = self._size - 1 - index
+        while index >= len(block.itens):
+            index -= len(block.itens)
+            block = block.prev
+        return block, len(block.itens) - 1 - index
 
-    def atender_proximo(self):
-        if self.fila_de_pedidos.is_empty():
-            print("\nFila vazia. Ninguém para atender.")
-            return None
-        usuario_atendido = self.fila_de_pedidos.dequeue()
-        print(f"\n<< {usuario_atendido.nome} foi atendido.")
-        self.atualizar_tempos_todos()
-        return usuario_atendido
+    # --- Operações nas pontas ---
+    def push(self, item):
+        """Insere um item no início da lista (O(1))."""
+        if self._head is None or len(self._head.itens) >= self._tamanho_bloco:
+            self._link_after(None, BlocoNode())
+        self._head.itens.insert(0, item)
+        self._size += 1
 
-    def desistir(self, usuario):
-        if self.fila_de_pedidos.remove_item(usuario):
-            print(f"\n!! {usuario.nome} desistiu e foi removido da fila.")
-            self.atualizar_tempos_todos()
-        else:
-            print(f"\n!! {usuario.nome} não encontrado na fila.")
+    def push_back(self, item):
+        """Insere um item no fim da lista (O(1))."""
+        if self._tail is None or len(self._tail.itens) >= self._tamanho_bloco:
+            self._link_after(self._tail, BlocoNode())
+        self._tail.itens.append(item)
+        self._size += 1
 
-    def atualizar_tempos_todos(self):
-        print("   -- Atualizando tempos de espera de todos na fila... --")
-        agora = datetime.datetime.now()
-        tempo_acumulado = datetime.timedelta()
-        for usuario in self.fila_de_pedidos:
-            tempo_acumulado += self.tempo_medio_atendimento
-            usuario.hora_estimada_atendimento = agora + tempo_acumulado
-            print(f"      - {usuario.nome}: Novo horário estimado {usuario.hora_estimada_atendimento.strftime('%H:%M:%S')}")
+    def pop(self):
+        """Remove e retorna o item do início da lista (O(1))."""
+        if self.is_empty(): raise IndexError("Remoção de uma lista vazia (underflow).")
+        block = self._head
+        item_removido = block.itens.pop(0)
+        if not block.itens: self._unlink(block)
+        self._size -= 1
+        return item_removido
 
-    def visualizar_fila(self):
-        print("\n--- Fila do Bandejão Atual ---")
-        if self.fila_de_pedidos.is_empty():
-            print("A fila está vazia.")
+    def pop_back(self):
+        """Remove e retorna o item do fim da lista (O(1))."""
+        if self.is_empty(): raise IndexError("Remoção de uma lista vazia (underflow).")
+        block = self._tail
+        item_removido = block.itens.pop()
+        if not block.itens: self._unlink(block)
+        self._size -= 1
+        return item_removido
+
+    # --- Acesso e edição por posição ---
+    def find_at(self, index):
+        """Consulta (sem remover) o item na i-ésima posição, pulando blocos inteiros."""
+        if not 0 <= index < self._size: raise IndexError("Índice fora dos limites.")
+        block, offset = self._locate(index)
+        return block.itens[offset]
+
+    def insert_at(self, index, item):
+        """Insere um item na posição index, dividindo o bloco se ele encher."""
+        if not 0 <= index <= self._size: raise IndexError("Índice de inserção fora dos limites.")
+        if index == self._size:
+            self.push_back(item)
             return
-        for i, usuario in enumerate(self.fila_de_pedidos):
-            print(f"{i+1}. {usuario.nome} - Retirada às: {usuario.hora_estimada_atendimento.strftime('%H:%M:%S')}")
-        print("----------------------------")
+        block, offset = self._locate(index)
+        block.itens.insert(offset, item)
+        self._size += 1
+        if len(block.itens) > self._tamanho_bloco:
+            self._split(block)
+
+    def remove_at(self, index):
+        """Remove e retorna o item na posição index, juntando blocos pouco ocupados."""
+        if not 0 <= index < self._size: raise IndexError("Índice de remoção fora dos limites.")
+        block, offset = self._locate(index)
+        item_removido = block.itens.pop(offset)
+        self._size -= 1
+        self._after_removal(block)
+        return item_removido
+
+    def remove_first(self, item):
+        """Remove a primeira ocorrência do item. Retorna True se encontrou."""
+        block = self._head
+        while block:
+            if item in block.itens:
+                block.itens.remove(item)
+                self._size -= 1
+                self._after_removal(block)
+                return True
+            block = block.next
+        return False
+
+    def __iter__(self):
+        block = self._head
+        while block:
+            yield from block.itens
+            block = block.next
+
+    # --- Implementação dos métodos abstratos ---
+    def insert(self, item, **kwargs): self.push_back(item)
+    def remove(self, **kwargs): return self.pop_back()
+    def find(self, key_value, **kwargs):
+        for item in self:
+            if item == key_value: return item
+        raise ValueError(f"Chave '{key_value}' não encontrada.")
+    def __str__(self):
+        return f"ListaDesenrolada: [{' <-> '.join(str(item) for item in self)}]"
 
 # =============================================================================
-# BLOCO DE TESTE
+# CLASSE LISTA DE SALTOS INDEXADA (INDEXABLE SKIP LIST)
 # =============================================================================
 
-if __name__ == "__main__":
-    # --- Teste da Classe Lista Duplamente Encadeada ---
-    print("--- Teste: Lista Duplamente Encadeada ---")
-    lista_d = ListaDuplamenteEncadeada([10, 30, 20])
-    print(f"Lista inicial: {lista_d}")
-    lista_d.push(0)
-    lista_d.push_back(40)
-    print(f"Após push(0) e push_back(40): {lista_d}")
-    print(f"Pop: {lista_d.pop()}, Pop Back: {lista_d.pop_back()}")
-    print(f"Lista após pops: {lista_d}")
-    print("Ordenando a lista com bubble sort...")
-    lista_d.bubble_sort()
-    print(f"Lista ordenada: {lista_d}")
-    print("-" * 40)
+class SaltoNode:
+    """Nó da Lista de Saltos: um ponteiro e uma largura (itens pulados) por nível."""
+    __slots__ = ('data', 'next', 'width')
 
-    # --- Teste da Classe Fila ---
-    print("\n--- Teste: Fila ---")
-    fila = Fila()
-    fila.enqueue('X'); fila.enqueue('Y'); fila.enqueue('Z')
+    def __init__(self, data, levels):
+        self.data = data
+        self.next = [None] * levels
+        self.width = [1] * levels
+
+    def __repr__(self):
+        return f"SaltoNode(data={self.data})"
+
+class ListaDeSaltosIndexada(EstruturaLinear):
+    """
+    Sequência posicional baseada em uma lista de saltos (skip list) indexável.
+    Cada ligação guarda quantas posições ela pula (largura), o que permite
+    descer pelos níveis até a posição desejada em O(log n) esperado.
+
+    find_at, insert_at, remove_at e swap são O(log n); push/push_back/pop/pop_back
+    são casos particulares de insert_at/remove_at.
+    """
+    MAX_LEVEL = 32
+
+    def __init__(self, iterable=None, seed=None):
+        """
+        Construtor da lista.
+        :param iterable: Itens iniciais (inseridos no fim, em ordem).
+        :param seed: Semente do sorteio de níveis, para execuções reprodutíveis.
+        """
+        self._head = SaltoNode(None, self.MAX_LEVEL)
+        self._levels = 1
+        self._size = 0
+        self._random = random.Random(seed)
+        if iterable is not None:
+            for item in iterable:
+                self.push_back(item)
+
+    def __len__(self):
+        return self._size
+
+    def _random_level(self):
+        """Sorteia o nível de um novo nó (cada nível extra com probabilidade 1/2)."""
+        level = 1
+        while level < self.MAX_LEVEL and self._random.random() < 0.5:
+            level += 1
+        return level
+
+    def _predecessors(self, index):
+        """
+        Para cada nível, retorna o último nó antes da posição index e a posição
+        desse nó (a cabeça fica na posição -1).
+        """
+        update = [None] * self._levels
+        steps = [0] * self._levels
+        node, pos = self._head, -1
+        for lvl in range(self._levels - 1, -1, -1):
+            while node.next[lvl] is not None and pos + node.width[lvl] < index:
+                pos += node.width[lvl]
+                node = node.next[lvl]
+            update[lvl], steps[lvl] = node, pos
+        return update, steps
+
+    def _node_at(self, index):
+        """Retorna o nó na posição index (O(log n))."""
+        if not 0 <= index < self._size: raise IndexError("Índice fora dos limites.")
+        node, pos = self._head, -1
+        for lvl in range(self._levels - 1, -1, -1):
+            while node.next[lvl] is not None and pos + node.width[lvl] <= index:
+                pos += node.width[lvl]
+                node = node.next[lvl]
+        return node
+
+    def find_at(self, index):
+        """Consulta (sem remover) o item na i-ésima posição (O(log n))."""
+        return self._node_at(index).data
+
+    def insert_at(self, index, item):
+        """Insere um item na posição index (O(log n))."""
+        if not 0 <= index <= self._size: raise IndexError("Índice de inserção fora dos limites.")
+        level = self._random_level()
+        while self._levels < level:
+            # Níveis novos da cabeça ligam direto ao fim (posição virtual size)
+            self._head.next[self._levels] = None
+            self._head.width[self._levels] = self._size + 1
+            self._levels += 1
+        update, steps = self._predecessors(index)
+        new_node = SaltoNode(item, level)
+        for lvl in range(self._levels):
+            pred = update[lvl]
+            if lvl < level:
+                new_node.next[lvl] = pred.next[lvl]
+                new_node.width[lvl] = pred.width[lvl] - (index - steps[lvl]) + 1
+                pred.next[lvl] = new_node
+                pred.width[lvl] = index - steps[lvl]
+            else:
+                pred.width[lvl] += 1
+        self._size += 1
+
+    def remove_at(self, index):
+        """Remove e retorna o item na posição index (O(log n))."""
+        if not 0 <= index < self._size: raise IndexError("Índice de remoção fora dos limites.")
+        update, _ = self._predecessors(index)
+        target = update[0].next[0]
+        for lvl in range(self._levels):
+            pred = update[lvl]
+            if pred.next[lvl] is target:
+                pred.next[lvl] = target.next[lvl]
+                pred.width[lvl] += target.width[lvl] - 1
+            else:
+                pred.width[lvl] -= 1
+        self._size -= 1
+        return target.data
+
+    def swap(self, index1, index2):
+        """Troca os dados de duas posições quaisquer (O(log n))."""
+        node1, node2 = self._node_at(index1), self._node_at(index2)
+        node1.data, node2.data = node2.data, node1.data
+
+    def push(self, item): self.insert_at(0, item)
+    def push_back(self, item): self.insert_at(self._size, item)
+    def pop(self):
+        if self.is_empty(): raise IndexError("Remoção de uma lista vazia (underflow).")
+        return self.remove_at(0)
+    def pop_back(self):
+        if self.is_empty(): raise IndexError("Remoção de uma lista vazia (underflow).")
+        return self.remove_at(self._size - 1)
+
+    def __iter__(self):
+        node = self._head.next[0]
+        while node:
+            yield node.data
+            node = node.next[0]
+
+    # --- Implementação dos métodos abstratos ---
+    def insert(self, item, **kwargs): self.push_back(item)
+    def remove(self, **kwargs): return self.pop_back()
+    def find(self, key_value, **kwargs):
+        for item in self:
+            if item == key_value: return item
+        raise ValueError(f"Chave '{key_value}' não encontrada.")
+    def __str__(self):
+        return f"ListaDeSaltos: [{' -> '.join(str(item) for item in self)}]"
+
+# =============================================================================
+# DEQUE CIRCULAR (RING BUFFER) DE CAPACIDADE FIXA
+# =============================================================================
+
+class DequeCircular(EstruturaLinear):
+    """
+    Deque sobre um buffer circular pré-alocado: inserir e remover nas duas
+    pontas é O(1) e, em regime, não aloca nada por item (não há nós; com
+    typecode, os itens ficam em um array.array compacto, como na classe Array).
+
+    A política de estouro decide o que acontece ao inserir com o buffer cheio:
+    - 'rejeitar': lança IndexError;
+    - 'sobrescrever': descarta o item da outra ponta (o mais antigo, para
+      push_back) e o retorna;
+    - 'crescer': dobra a capacidade (cópia única, O(n)).
+    """
+    POLITICAS = ('rejeitar', 'sobrescrever', 'crescer')
+
+    def __init__(self, capacidade=16, politica='rejeitar', typecode=None, iterable=None):
+        if capacidade < 1:
+            raise ValueError("A capacidade deve ser pelo menos 1.")
+        if politica not in self.POLITICAS:
+            raise ValueError(f"Política '{politica}' desconhecida. Use uma de: {', '.join(self.POLITICAS)}.")
+        self.politica = politica
+        self._typecode = typecode
+        self._dados = self._alocar(capacidade)
+        self._inicio = 0
+        self._tamanho = 0
+        if iterable is not None:
+            for item in iterable:
+                self.push_back(item)
+
+    def _alocar(self, capacidade):
+        if self._typecode is None:
+            return [None] * capacidade
+        return array.array(self._typecode, [0]) * capacidade
+
+    def __len__(self):
+        return self._tamanho
+
+    @property
+    def capacidade(self):
+        return len(self._dados)
+
+    def is_full(self):
+        """Verifica se o buffer está cheio (a próxima inserção aciona a política)."""
+        return self._tamanho == len(self._dados)
+
+    def _fisico(self, index):
+        """Posição no buffer do item na posição lógica index."""
+        return (self._inicio + index) % len(self._dados)
+
+    def _liberar(self, posicao):
+        """Solta a referência guardada na posição (não se aplica a arrays tipados)."""
+        if self._typecode is None:
+            self._dados[posicao] = None
+
+    def _crescer(self):
+        """Dobra a capacidade, copiando os itens em ordem para o começo do novo buffer."""
+        antigo, n = self._dados, self._tamanho
+        self._dados = self._alocar(2 * len(antigo))
+        fim = self._inicio + n
+        # Até dois blocos contíguos: do início ao fim do buffer e o que deu a volta
+        primeiro = antigo[self._inicio:min(fim, len(antigo))]
+        self._dados[:len(primeiro)] = primeiro
+        self._dados[len(primeiro):n] = antigo[:max(0, fim - len(antigo))]
+        self._inicio = 0
+
+    def push_back(self, item):
+        """
+        Insere no fim (O(1)). Com o buffer cheio, aplica a política; em
+        'sobrescrever', retorna o item descartado do início.
+        """
+        descartado = None
+        if self.is_full():
+            if self.politica == 'rejeitar':
+                raise IndexError("Deque circular cheio (overflow).")
+            if self.politica == 'crescer':
+                self._crescer()
+            else:
+                descartado = self.pop()
+        self._dados[self._fisico(self._tamanho)] = item
+        self._tamanho += 1
+        return descartado
+
+    def push(self, item):
+        """
+        Insere no início (O(1)). Com o buffer cheio, aplica a política; em
+        'sobrescrever', retorna o item descartado do fim.
+        """
+        descartado = None
+        if self.is_full():
+            if self.politica == 'rejeitar':
+                raise IndexError("Deque circular cheio (overflow).")
+            if self.politica == 'crescer':
+                self._crescer()
+            else:
+                descartado = self.pop_back()
+        self._inicio = (self._inicio - 1) % len(self._dados)
+        self._dados[self._inicio] = item
+        self._tamanho += 1
+        return descartado
+
+    def pop(self):
+        """Remove e retorna o item do início (O(1))."""
+        if self._tamanho == 0:
+            raise IndexError("Remoção de um deque vazio (underflow).")
+        item = self._dados[self._inicio]
+        self._liberar(self._inicio)
+        self._inicio = (self._inicio + 1) % len(self._dados)
+        self._tamanho -= 1
+        return item
+
+    def pop_back(self):
+        """Remove e retorna o item do fim (O(1))."""
+        if self._tamanho == 0:
+            raise IndexError("Remoção de um deque vazio (underflow).")
+        posicao = self._fisico(self._tamanho - 1)
+        item = self._dados[posicao]
+        self._liberar(posicao)
+        self._tamanho -= 1
+        return item
+
+    def find_at(self, index):
+        """Consulta o item na posição index (O(1))."""
+        if not 0 <= index < self._tamanho:
+            raise IndexError("Índice fora dos limites.")
+        return self._dados[self._fisico(index)]
+
+    def set_at(self, index, item):
+        if not 0 <= index < self._tamanho:
+            raise IndexError("Índice fora dos limites.")
+        self._dados[self._fisico(index)] = item
+
+    def remove_first(self, item):
+        """
+        Remove a primeira ocorrência do item, deslocando os seguintes uma
+        posição para trás (O(n)). Retorna True se encontrou.
+        """
+        for i in range(self._tamanho):
+            if self._dados[self._fisico(i)] == item:
+                for j in range(i, self._tamanho - 1):
+                    self._dados[self._fisico(j)] = self._dados[self._fisico(j + 1)]
+                self._liberar(self._fisico(self._tamanho - 1))
+                self._tamanho -= 1
+                return True
+        return False
+
+    def __iter__(self):
+        for i in range(self._tamanho):
+            yield self._dados[(self._inicio + i) % len(self._dados)]
+
+    # --- Implementação dos métodos abstratos ---
+    def insert(self, item, **kwargs): return self.push_back(item)
+    def remove(self, **kwargs): return self.pop()
+    def find(self, key_value, **kwargs):
+        for item in self:
+            if item == key_value: return item
+        raise ValueError(f"Chave '{key_value}' não encontrada.")
+    def __str__(self):
+        return f"DequeCircular({self._tamanho}/{len(self._dados)}): [{' <-> '.join(str(item) for item in self)}]"
+
+# =============================================================================
+# CLASSE FILA (QUEUE) - (NOVA - Parte 6)
+# =============================================================================
+
+class Fila(EstruturaLinear):
+    """
+    Implementação de uma Fila (Queue) usando composição com
+    ListaDuplamenteEncadeada. A lógica é FIFO (First-In, First-Out).
+    Outra lista com push_back/pop (ex: ListaDesenrolada) pode ser passada
+    como armazenamento interno.
+
+    Com a lista padrão, enqueue retorna um handle (o nó do item) que permite
+    cancelar o item em O(1) com cancel(handle). Com indexar=True, a fila também
+    guarda um índice id(item) -> nós, e remove_item passa a ser O(1), comparando
+    os itens por identidade (is) em vez de igualdade (==).
+
+    Com uma RodaDeTemporizacao (roda), enqueue aceita um prazo: se o item ainda
+    estiver na fila quando a roda passar do prazo, ele sai sozinho (O(1), pelo
+    handle) e ao_expirar(item) é chamado. Sair antes (dequeue, cancel,
+    remove_item) cancela o prazo, também em O(1).
+    """
+    def __init__(self, lista=None, indexar=False, roda=None, ao_expirar=None):
+        self._lista = lista if lista is not None else ListaDuplamenteEncadeada()
+        self._indice = {} if indexar else None
+        self._roda = roda
+        self.ao_expirar = ao_expirar
+        self._prazos = {}   # handle (nó) -> Temporizador
+
+    def __len__(self):
+        return len(self._lista)
+
+    def is_full(self):
+        """A fila está cheia quando a lista interna está (ex: um DequeCircular)."""
+        return self._lista.is_full()
+
+    def enqueue(self, item, prazo=None):
+        """
+        Adiciona um item ao final da fila (O(1)) e retorna o seu handle.
+        :param prazo: Instante (no tempo da roda) em que o item desiste de esperar.
+        """
+        if prazo is not None and (self._roda is None or not hasattr(self._lista, 'remove_node')):
+            raise TypeError("Prazos exigem uma roda de temporização e a lista padrão da fila.")
+        handle = self._lista.push_back(item)
+        if self._indice is not None:
+            self._indice.setdefault(id(item), []).append(handle)
+        if prazo is not None:
+            self._prazos[handle] = self._roda.agendar(prazo, self._expirar, handle)
+        return handle
+
+    def _expirar(self, handle):
+        """Chamado pela roda quando o prazo de um item vence."""
+        item = handle.data
+        if self.cancel(handle) and self.ao_expirar is not None:
+            self.ao_expirar(item)
+
+    def _cancelar_prazo(self, handle):
+        temporizador = self._prazos.pop(handle, None)
+        if temporizador is not None:
+            temporizador.cancel()
+
+    def dequeue(self):
+        """Remove e retorna o item do início da fila (O(1))."""
+        if self.is_empty(): raise IndexError("Fila vazia (Queue underflow).")
+        if self._prazos:
+            self._cancelar_prazo(self._lista.peek_node())
+        item = self._lista.pop()
+        if self._indice is not None:
+            # O nó removido é sempre a ocorrência mais antiga desse item
+            self._desindexar(item, 0)
+        return item
+
+    def _desindexar(self, item, posicao):
+        """Tira do índice o nó na posição informada da lista de ocorrências do item."""
+        nodes = self._indice[id(item)]
+        del nodes[posicao]
+        if not nodes:
+            del self._indice[id(item)]
+
+    def cancel(self, handle):
+        """
+        Remove da fila, em O(1), o item do handle retornado por enqueue.
+        Retorna False se o item já tinha saído da fila (atendido ou cancelado)
+        ou se o handle é de outra fila.
+        Lança um TypeError se a lista interna não suportar handles.
+        """
+        if not hasattr(self._lista, 'remove_node'):
+            raise TypeError("A lista interna desta fila não suporta cancelamento por handle.")
+        if not self._lista.remove_node(handle):
+            return False
+        if self._prazos:
+            self._cancelar_prazo(handle)
+        if self._indice is not None:
+            nodes = self._indice[id(handle.data)]
+            self._desindexar(handle.data, next(i for i, n in enumerate(nodes) if n is handle))
+        return True
+
+    def peek(self):
+        """Retorna o item do início da fila sem removê-lo."""
+        if self.is_empty(): raise IndexError("Fila vazia.")
+        return self._lista.find_at(0)
+
+    def peek_back(self):
+        """Retorna o item do fim da fila sem removê-lo."""
+        if self.is_empty(): raise IndexError("Fila vazia.")
+        return self._lista.find_at(len(self) - 1)
+
+    def remove_item(self, item_to_remove):
+        """
+        Remove um item específico da fila (para desistências).
+        Com índice, é O(1) e remove a ocorrência mais antiga desse mesmo objeto;
+        sem índice, percorre a fila comparando com ==.
+        """
+        if self._indice is not None:
+            nodes = self._indice.get(id(item_to_remove))
+            return self.cancel(nodes[0]) if nodes else False
+        if self._prazos:
+            # Sem índice, procura o nó do primeiro item igual para cancelar também o seu prazo
+            node = self._lista.find_node(item_to_remove)
+            return self.cancel(node) if node is not None else False
+        return self._lista.remove_first(item_to_remove)
+
+    # --- Implementação dos métodos abstratos ---
+    def insert(self, item, **kwargs): self.enqueue(item)
+    def remove(self, **kwargs): return self.dequeue()
+    def find(self, **kwargs): return self.peek()
+    def __iter__(self): return iter(self._lista)
+    def __str__(self): return f"Fila: {str(self._lista)}"
+
+class FilaCircular(Fila):
+    """
+    Fila de capacidade fixa sobre um DequeCircular: sem um nó por item e com
+    is_full significativo. Em 'sobrescrever', enqueue descarta (e retorna) o
+    item mais antigo quando a fila está cheia. Não há handles: cancel não é
+    suportado e remove_item desloca os itens (O(n)).
+    """
+    def __init__(self, capacidade=16, politica='rejeitar', typecode=None):
+        super().__init__(DequeCircular(capacidade, politica, typecode))
+
+# =============================================================================
+# FILA E PILHA CONCORRENTES (VÁRIAS THREADS)
+# =============================================================================
+
+class _Sincronizada:
+    """
+    Mixin com a trava e as condições usadas pelas estruturas concorrentes.
+    As subclasses definem _inserir e _retirar (chamados com a trava adquirida)
+    e usam uma lista interna _lista.
+    """
+    def _iniciar_sincronizacao(self, capacidade):
+        if capacidade is not None and capacidade < 1:
+            raise ValueError("A capacidade deve ser pelo menos 1.")
+        self.capacidade = capacidade
+        # Reentrante: métodos herdados chamam outros que também travam (ex: remove_item -> cancel)
+        self._trava = threading.RLock()
+        self._nao_vazia = threading.Condition(self._trava)
+        self._nao_cheia = threading.Condition(self._trava)
+
+    def _tem_espaco(self):
+        return self.capacidade is None or len(self._lista) < self.capacidade
+
+    def _tem_itens(self):
+        return len(self._lista) > 0
+
+    def __len__(self):
+        # Ler o tamanho é uma única leitura de atributo: não precisa da trava
+        return len(self._lista)
+
+    def is_full(self):
+        """Verifica se a estrutura atingiu a capacidade (sempre False sem capacidade)."""
+        with self._trava:
+            return not self._tem_espaco()
+
+    def put(self, item, block=True, timeout=None):
+        """
+        Insere um item. Se estiver cheia, espera por espaço (até timeout segundos).
+        Lança IndexError se block=False e estiver cheia, ou TimeoutError se o
+        tempo acabar.
+        """
+        with self._trava:
+            if not self._tem_espaco():
+                if not block:
+                    raise IndexError("Estrutura cheia (overflow).")
+                if not self._nao_cheia.wait_for(self._tem_espaco, timeout):
+                    raise TimeoutError("Tempo esgotado esperando por espaço.")
+            resultado = self._inserir(item)
+            self._nao_vazia.notify()
+            return resultado
+
+    def get(self, block=True, timeout=None):
+        """
+        Remove e retorna um item. Se estiver vazia, espera (até timeout segundos).
+        Lança IndexError se block=False e estiver vazia, ou TimeoutError se o
+        tempo acabar.
+        """
+        with self._trava:
+            if not self._tem_itens():
+                if not block:
+                    raise IndexError("Estrutura vazia (underflow).")
+                if not self._nao_vazia.wait_for(self._tem_itens, timeout):
+                    raise TimeoutError("Tempo esgotado esperando por um item.")
+            item = self._retirar()
+            self._nao_cheia.notify()
+            return item
+
+    def put_many(self, itens, block=True, timeout=None):
+        """
+        Insere vários itens adquirindo a trava uma vez por lote (e não por item).
+        Se faltar espaço, insere o que couber e espera pelo resto (se block=True),
+        até timeout segundos no total. Retorna quantos itens entraram.
+        """
+        itens = list(itens)
+        prazo = None if timeout is None else time.monotonic() + timeout
+        inseridos = 0
+        with self._trava:
+            while inseridos < len(itens):
+                if not self._tem_espaco():
+                    restante = None if prazo is None else prazo - time.monotonic()
+                    if not block or not self._nao_cheia.wait_for(self._tem_espaco, restante):
+                        break
+                livre = len(itens) if self.capacidade is None else self.capacidade - len(self._lista)
+                fim = min(len(itens), inseridos + livre)
+                for i in range(inseridos, fim):
+                    self._inserir(itens[i])
+                self._nao_vazia.notify(fim - inseridos)
+                inseridos = fim
+        return inseridos
+
+    def get_many(self, max_n, block=True, timeout=None):
+        """
+        Remove até max_n itens adquirindo a trava uma vez. Se estiver vazia,
+        espera pelo primeiro item (se block=True, até timeout segundos).
+        Retorna a lista de itens, possivelmente vazia.
+        """
+        with self._trava:
+            if not self._tem_itens():
+                if not block or not self._nao_vazia.wait_for(self._tem_itens, timeout):
+                    return []
+            itens = [self._retirar() for _ in range(min(max_n, len(self._lista)))]
+            self._nao_cheia.notify(len(itens))
+            return itens
+
+class FilaConcorrente(_Sincronizada, Fila):
+    """
+    Fila segura para várias threads produtoras e consumidoras, com capacidade
+    opcional (que torna is_full significativo), put/get bloqueantes com
+    timeout e operações em lote (enqueue_many/dequeue_many).
+    Prazos (roda de temporização) não são suportados aqui.
+    """
+    def __init__(self, capacidade=None, lista=None, indexar=False):
+        Fila.__init__(self, lista, indexar)
+        self._iniciar_sincronizacao(capacidade)
+
+    def _inserir(self, item): return Fila.enqueue(self, item)
+    def _retirar(self): return Fila.dequeue(self)
+
+    def enqueue(self, item):
+        """Enfileira sem esperar; lança IndexError se a fila estiver cheia."""
+        return self.put(item, block=False)
+
+    def dequeue(self):
+        """Desenfileira sem esperar; lança IndexError se a fila estiver vazia."""
+        return self.get(block=False)
+
+    def enqueue_many(self, itens, block=True, timeout=None): return self.put_many(itens, block, timeout)
+    def dequeue_many(self, max_n, block=True, timeout=None): return self.get_many(max_n, block, timeout)
+
+    def cancel(self, handle):
+        with self._trava:
+            cancelado = Fila.cancel(self, handle)
+            if cancelado: self._nao_cheia.notify()
+            return cancelado
+
+    def remove_item(self, item_to_remove):
+        with self._trava:
+            removido = Fila.remove_item(self, item_to_remove)
+            if removido: self._nao_cheia.notify()
+            return removido
+
+    def peek(self):
+        with self._trava: return Fila.peek(self)
+
+    def peek_back(self):
+        with self._trava: return Fila.peek_back(self)
+
+    def __iter__(self):
+        """Itera sobre uma cópia da fila, tirada com a trava adquirida."""
+        with self._trava: return iter(list(self._lista))
+
+    def __str__(self):
+        with self._trava: return Fila.__str__(self)
+
+class PilhaConcorrente(_Sincronizada, Pilha):
+    """
+    Pilha segura para várias threads, com capacidade opcional, put/get
+    bloqueantes com timeout (LIFO) e operações em lote (push_many/pop_many).
+    """
+    def __init__(self, capacidade=None, lista=None):
+        Pilha.__init__(self, lista)
+        self._iniciar_sincronizacao(capacidade)
+
+    def _inserir(self, item): return Pilha.push(self, item)
+    def _retirar(self): return Pilha.pop(self)
+
+    def push(self, item):
+        """Empilha sem esperar; lança IndexError se a pilha estiver cheia."""
+        self.put(item, block=False)
+
+    def pop(self):
+        """Desempilha sem esperar; lança IndexError se a pilha estiver vazia."""
+        return self.get(block=False)
+
+    def push_many(self, itens, block=True, timeout=None): return self.put_many(itens, block, timeout)
+    def pop_many(self, max_n, block=True, timeout=None): return self.get_many(max_n, block, timeout)
+
+    def peek(self):
+        with self._trava: return Pilha.peek(self)
+
+    def __str__(self):
+        with self._trava: return Pilha.__str__(self)
+
+def medir_vazao_concorrente(n_threads, n_itens=100_000, lote=1, capacidade=1024):
+    """
+    Mede a vazão (itens por segundo) de uma FilaConcorrente com n_threads
+    produtoras e n_threads consumidoras, movendo n_itens no total em lotes de
+    `lote` itens (lote=1 usa put/get item a item).
+    """
+    fila = FilaConcorrente(capacidade=capacidade)
+    por_thread = n_itens // n_threads
+
+    def produtor():
+        if lote == 1:
+            for i in range(por_thread): fila.put(i)
+        else:
+            for inicio in range(0, por_thread, lote):
+                fila.enqueue_many(range(inicio, min(por_thread, inicio + lote)))
+
+    def consumidor():
+        # Cada consumidor retira exatamente o que um produtor insere
+        restante = por_thread
+        if lote == 1:
+            for _ in range(restante): fila.get()
+        else:
+            while restante:
+                restante -= len(fila.dequeue_many(min(lote, restante)))
+
+    threads = [threading.Thread(target=alvo) for alvo in (produtor, consumidor) for _ in range(n_threads)]
+    inicio = time.perf_counter()
+    for t in threads: t.start()
+    for t in threads: t.join()
+    return por_thread * n_threads / (time.perf_counter() - inicio)
+
+# =============================================================================
+# FILA ASSÍNCRONA (ASYNCIO)
+# =============================================================================
+
+class AsyncFila(EstruturaLinear):
+    """
+    Fila para asyncio sobre a ListaDuplamenteEncadeada: `await get()` e
+    `await put()` suspendem a corrotina em um future (sem polling) até haver
+    item ou espaço.
+
+    Com limite_alto, os produtores são suspensos quando a fila atinge esse
+    tamanho e só voltam quando ela baixa até limite_baixo (padrão:
+    limite_alto - 1, ou seja, um limite simples). get_batch retira muitos
+    itens de uma vez, sem voltar ao laço de eventos entre eles.
+
+    As esperas são seguras contra cancelamento: uma corrotina cancelada sai
+    da lista de espera em O(1), e se já tinha sido acordada, repassa a vez.
+    """
+    def __init__(self, limite_alto=None, limite_baixo=None):
+        if limite_alto is not None:
+            if limite_baixo is None:
+                limite_baixo = limite_alto - 1
+            if not 0 <= limite_baixo < limite_alto:
+                raise ValueError("Use 0 <= limite_baixo < limite_alto.")
+        self.limite_alto = limite_alto
+        self.limite_baixo = limite_baixo
+        self._lista = ListaDuplamenteEncadeada()
+        self._consumidores = ListaDuplamenteEncadeada()   # futures de quem espera item
+        self._produtores = ListaDuplamenteEncadeada()     # futures de quem espera espaço
+        self._pausada = False
+
+    def __len__(self):
+        return len(self._lista)
+
+    def is_full(self):
+        """True enquanto os produtores estão suspensos pelo limite alto."""
+        return self._pausada
+
+    def _acordar(self, esperando, n=1):
+        """Acorda até n corrotinas da lista de espera (na ordem de chegada)."""
+        while n > 0 and not esperando.is_empty():
+            futuro = esperando.pop()
+            if not futuro.done():
+                futuro.set_result(None)
+                n -= 1
+
+    async def _esperar(self, esperando, pronto):
+        """Suspende até ser acordado; em caso de cancelamento, repassa a vez se pronto()."""
+        futuro = asyncio.get_running_loop().create_future()
+        node = esperando.push_back(futuro)
+        try:
+            await futuro
+        except BaseException:
+            esperando.remove_node(node)
+            if futuro.done() and not futuro.cancelled() and pronto():
+                # Fomos acordados, mas cancelados antes de agir: acorda o próximo
+                self._acordar(esperando)
+            raise
+
+    def put_nowait(self, item):
+        """Enfileira sem esperar; lança IndexError se os produtores estiverem suspensos."""
+        if self._pausada:
+            raise IndexError("Fila cheia (Queue overflow).")
+        handle = self._lista.push_back(item)
+        if self.limite_alto is not None and len(self._lista) >= self.limite_alto:
+            self._pausada = True
+        self._acordar(self._consumidores)
+        return handle
+
+    async def put(self, item):
+        """Enfileira; se a fila atingiu o limite alto, espera até ela esvaziar o bastante."""
+        while self._pausada:
+            await self._esperar(self._produtores, lambda: not self._pausada)
+        return self.put_nowait(item)
+
+    def _apos_retirar(self):
+        """Reabre a fila para os produtores ao chegar no limite baixo."""
+        if self._pausada and len(self._lista) <= self.limite_baixo:
+            self._pausada = False
+        if not self._pausada and self.limite_alto is not None:
+            self._acordar(self._produtores, self.limite_alto - len(self._lista))
+
+    def get_nowait(self):
+        """Desenfileira sem esperar; lança IndexError se a fila estiver vazia."""
+        if self.is_empty():
+            raise IndexError("Fila vazia (Queue underflow).")
+        item = self._lista.pop()
+        self._apos_retirar()
+        return item
+
+    async def get(self):
+        """Desenfileira, esperando (sem polling) se a fila estiver vazia."""
+        while self.is_empty():
+            await self._esperar(self._consumidores, lambda: not self.is_empty())
+        return self.get_nowait()
+
+    async def get_batch(self, max_n, timeout=None):
+        """
+        Espera pelo menos um item (até timeout segundos) e retira até max_n de
+        uma vez. Retorna a lista de itens (vazia se o tempo acabar).
+        """
+        if self.is_empty():
+            try:
+                await asyncio.wait_for(self._esperar_item(), timeout)
+            except asyncio.TimeoutError:
+                return []
+        itens = [self._lista.pop() for _ in range(min(max_n, len(self._lista)))]
+        self._apos_retirar()
+        if not self.is_empty():
+            # Sobrou item: outro consumidor pode estar esperando
+            self._acordar(self._consumidores)
+        return itens
+
+    async def _esperar_item(self):
+        while self.is_empty():
+            await self._esperar(self._consumidores, lambda: not self.is_empty())
+
+    def peek(self):
+        if self.is_empty(): raise IndexError("Fila vazia.")
+        return self._lista.find_at(0)
+
+    # --- Implementação dos métodos abstratos ---
+    def insert(self, item, **kwargs): self.put_nowait(item)
+    def remove(self, **kwargs): return self.get_nowait()
+    def find(self, **kwargs): return self.peek()
+    def __iter__(self): return iter(self._lista)
+    def __str__(self): return f"AsyncFila: {str(self._lista)}"
+
+# =============================================================================
+# FILA EM MEMÓRIA COMPARTILHADA ENTRE PROCESSOS (SPSC)
+# =============================================================================
+
+class FilaMemoriaCompartilhada(EstruturaLinear):
+    """
+    Fila limitada de mensagens em bytes sobre multiprocessing.shared_memory,
+    para um produtor e um consumidor em processos diferentes (SPSC), sem
+    pickle nem pipe: cada lado só escreve o seu contador (cauda para o
+    produtor, cabeça para o consumidor), em linhas de cache separadas.
+
+    Dois formatos de registro:
+    - tamanho_registro=N: todo registro tem exatamente N bytes;
+    - tamanho_registro=None: registros de tamanho variável, prefixados pelo
+      comprimento (4 bytes) e alinhados em 4 bytes; um registro que não cabe
+      antes do fim do buffer é escrito no começo, após uma marca de pulo.
+      Cada registro ocupa no máximo metade da capacidade: assim o pulo mais o
+      registro sempre cabem quando a fila esvazia.
+
+    O acesso sem cópia é por memoryview: reservar(n) + publicar() no produtor
+    e dequeue_view() + confirmar_leitura() no consumidor. enqueue/dequeue
+    fazem uma cópia e lançam IndexError com a fila cheia/vazia; put/get
+    esperam (com recuo exponencial) e lançam TimeoutError.
+
+    Para vários produtores ou consumidores, cada lado precisa de uma trava
+    própria (ex: multiprocessing.Lock) em volta das operações.
+
+    O objeto pode ser passado a outro processo (ex: como argumento de um
+    multiprocessing.Process): lá ele se anexa ao mesmo segmento pelo nome.
+    Quem criou a fila deve chamar unlink() no fim.
+    """
+    # Índices (em palavras de 8 bytes) do cabeçalho; cada grupo em sua linha de cache
+    _CAUDA, _ESCRITOS = 0, 1          # escritos só pelo produtor
+    _CABECA, _LIDOS = 8, 9            # escritos só pelo consumidor
+    _CAPACIDADE, _REGISTRO = 16, 17   # fixos
+    _TAMANHO_CABECALHO = 192
+    _PULO = 0xFFFFFFFF                # marca de "continue no começo do buffer"
+
+    def __init__(self, capacidade_bytes=1 << 20, tamanho_registro=None, nome=None, _anexar=False):
+        """
+        :param capacidade_bytes: Tamanho da área de dados (arredondado para
+                                 múltiplo do registro, ou de 4 bytes).
+        :param tamanho_registro: Bytes por registro (None: tamanho variável).
+        :param nome: Nome do segmento (padrão: gerado pelo sistema).
+        """
+        if _anexar:
+            self._shm = self._abrir_existente(nome)
+        else:
+            passo = tamanho_registro or 4
+            if tamanho_registro is not None and tamanho_registro < 1:
+                raise ValueError("O tamanho do registro deve ser pelo menos 1.")
+            capacidade_bytes -= capacidade_bytes % passo
+            if capacidade_bytes < passo:
+                raise ValueError("A capacidade não comporta nenhum registro.")
+            self._shm = multiprocessing.shared_memory.SharedMemory(
+                name=nome, create=True, size=self._TAMANHO_CABECALHO + capacidade_bytes)
+        self._cab = self._shm.buf[:self._TAMANHO_CABECALHO].cast('Q')
+        if not _anexar:
+            self._cab[self._CAPACIDADE] = capacidade_bytes
+            self._cab[self._REGISTRO] = tamanho_registro or 0
+        self._capacidade = self._cab[self._CAPACIDADE]
+        self.tamanho_registro = self._cab[self._REGISTRO] or None
+        self._dados = self._shm.buf[self._TAMANHO_CABECALHO:self._TAMANHO_CABECALHO + self._capacidade]
+        self._pendente_escrita = None   # (nova cauda, visão reservada)
+        self._pendente_leitura = None   # (nova cabeça, visão entregue)
+
+    @staticmethod
+    def _abrir_existente(nome):
+        """Anexa a um segmento existente sem registrá-lo para remoção ao fim deste processo."""
+        try:
+            return multiprocessing.shared_memory.SharedMemory(name=nome, track=False)
+        except TypeError:
+            # Python < 3.13 sempre registra o segmento no resource_tracker. Processos
+            # criados pelo multiprocessing compartilham o tracker de quem criou a
+            # fila, então o registro repetido é inofensivo (e não deve ser desfeito).
+            return multiprocessing.shared_memory.SharedMemory(name=nome)
+
+    @classmethod
+    def anexar(cls, nome):
+        """Abre, em outro processo, a fila criada com esse nome."""
+        return cls(nome=nome, _anexar=True)
+
+    def __reduce__(self):
+        return (FilaMemoriaCompartilhada.anexar, (self.nome,))
+
+    @property
+    def nome(self):
+        return self._shm.name
+
+    def __len__(self):
+        return self._cab[self._ESCRITOS] - self._cab[self._LIDOS]
+
+    def is_empty(self):
+        return self._cab[self._CAUDA] == self._cab[self._CABECA]
+
+    def is_full(self):
+        """
+        Verifica se não cabe mais nenhum registro (com tamanho variável, um
+        registro grande pode não caber mesmo com a fila não cheia).
+        """
+        livre = self._capacidade - (self._cab[self._CAUDA] - self._cab[self._CABECA])
+        return livre < (self.tamanho_registro or 4)
+
+    # --- Lado do produtor ---
+    def reservar(self, n):
+        """
+        Reserva espaço para um registro de n bytes e retorna uma memoryview
+        gravável onde ele deve ser escrito; o registro só fica visível ao
+        consumidor após publicar(). Lança IndexError se não houver espaço.
+        """
+        if self._pendente_escrita is not None:
+            raise RuntimeError("Há uma reserva ainda não publicada.")
+        cauda = self._cab[self._CAUDA]
+        livre = self._capacidade - (cauda - self._cab[self._CABECA])
+        offset = cauda % self._capacidade
+        if self.tamanho_registro is not None:
+            if n != self.tamanho_registro:
+                raise ValueError(f"O registro deve ter exatamente {self.tamanho_registro} bytes.")
+            if livre < n:
+                raise IndexError("Fila cheia (Queue overflow).")
+            visao = self._dados[offset:offset + n]
+            self._pendente_escrita = (cauda + n, visao)
+            return visao
+
+        ocupado = 4 + (n + 3) // 4 * 4
+        if ocupado > self._capacidade // 2:
+            # Ao dar a volta, o pulo (< ocupado) também precisa caber junto com o registro
+            raise ValueError("O registro (com o prefixo) passa da metade da capacidade da fila.")
+        pulo = self._capacidade - offset if offset + ocupado > self._capacidade else 0
+        if livre < pulo + ocupado:
+            raise IndexError("Fila cheia (Queue overflow).")
+        if pulo:
+            # O espaço até o fim (sempre >= 4 bytes, pelo alinhamento) ainda é nosso
+            struct.pack_into('<I', self._dados, offset, self._PULO)
+            offset = 0
+        struct.pack_into('<I', self._dados, offset, n)
+        visao = self._dados[offset + 4:offset + 4 + n]
+        self._pendente_escrita = (cauda + pulo + ocupado, visao)
+        return visao
+
+    def publicar(self):
+        """Torna visível ao consumidor o registro reservado."""
+        nova_cauda, visao = self._pendente_escrita
+        visao.release()
+        self._pendente_escrita = None
+        self._cab[self._ESCRITOS] += 1
+        # A cauda é escrita por último: o consumidor só lê o que ela cobre
+        self._cab[self._CAUDA] = nova_cauda
+
+    def enqueue(self, dados):
+        """Copia um objeto bytes-like para a fila (lança IndexError se estiver cheia)."""
+        dados = memoryview(dados).cast('B')
+        self.reservar(len(dados))[:] = dados
+        self.publicar()
+
+    # --- Lado do consumidor ---
+    def dequeue_view(self):
+        """
+        Retorna uma memoryview (somente leitura, sem cópia) do próximo registro.
+        Ela vale até confirmar_leitura(), que libera o espaço para o produtor.
+        Lança IndexError se a fila estiver vazia.
+        """
+        if self._pendente_leitura is not None:
+            raise RuntimeError("Há uma leitura ainda não confirmada.")
+        cabeca = self._cab[self._CABECA]
+        if cabeca == self._cab[self._CAUDA]:
+            raise IndexError("Fila vazia (Queue underflow).")
+        offset = cabeca % self._capacidade
+        if self.tamanho_registro is not None:
+            inicio, n, nova_cabeca = offset, self.tamanho_registro, cabeca + self.tamanho_registro
+        else:
+            n, = struct.unpack_from('<I', self._dados, offset)
+            if n == self._PULO:
+                cabeca += self._capacidade - offset
+                offset = 0
+                n, = struct.unpack_from('<I', self._dados, 0)
+            inicio, nova_cabeca = offset + 4, cabeca + 4 + (n + 3) // 4 * 4
+        visao = self._dados[inicio:inicio + n].toreadonly()
+        self._pendente_leitura = (nova_cabeca, visao)
+        return visao
+
+    def confirmar_leitura(self):
+        """Libera o registro lido por dequeue_view (a memoryview deixa de valer)."""
+        nova_cabeca, visao = self._pendente_leitura
+        visao.release()
+        self._pendente_leitura = None
+        self._cab[self._LIDOS] += 1
+        self._cab[self._CABECA] = nova_cabeca
+
+    def dequeue(self):
+        """Remove e retorna (como bytes) o próximo registro."""
+        dados = bytes(self.dequeue_view())
+        self.confirmar_leitura()
+        return dados
+
+    def peek(self):
+        """Retorna (como bytes) o próximo registro sem removê-lo."""
+        dados = bytes(self.dequeue_view())
+        self._pendente_leitura[1].release()
+        self._pendente_leitura = None
+        return dados
+
+    # --- Versões que esperam ---
+    @staticmethod
+    def _esperar(tentar, timeout, mensagem):
+        """Repete tentar() até não lançar IndexError, com recuo exponencial."""
+        prazo = None if timeout is None else time.monotonic() + timeout
+        pausa = 0.0
+        while True:
+            try:
+                return tentar()
+            except IndexError:
+                if prazo is not None and time.monotonic() >= prazo:
+                    raise TimeoutError(mensagem) from None
+                time.sleep(pausa)
+                pausa = min(0.001, pausa * 2 or 1e-6)
+
+    def put(self, dados, timeout=None):
+        """Enfileira, esperando por espaço (até timeout segundos)."""
+        self._esperar(lambda: self.enqueue(dados), timeout, "Tempo esgotado esperando por espaço.")
+
+    def get(self, timeout=None):
+        """Desenfileira, esperando por um registro (até timeout segundos)."""
+        return self._esperar(self.dequeue, timeout, "Tempo esgotado esperando por um registro.")
+
+    # --- Ciclo de vida ---
+    def close(self):
+        """Desanexa este processo do segmento (as memoryviews entregues devem ter sido liberadas)."""
+        self._dados.release()
+        self._cab.release()
+        self._shm.close()
+
+    def unlink(self):
+        """Remove o segmento do sistema (chamar uma vez, em quem criou a fila)."""
+        self._shm.unlink()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    # --- Implementação dos métodos abstratos ---
+    def insert(self, item, **kwargs): self.enqueue(item)
+    def remove(self, **kwargs): return self.dequeue()
+    def find(self, **kwargs): return self.peek()
+    def __str__(self):
+        return f"FilaMemoriaCompartilhada({self.nome}: {len(self)} registros, {self._capacidade} bytes)"
+
+def _produzir_em_memoria_compartilhada(fila, n_mensagens, tamanho):
+    mensagem = bytes(tamanho)
+    for _ in range(n_mensagens):
+        fila.put(mensagem)
+    fila.close()
+
+def _produzir_em_multiprocessing_queue(fila, n_mensagens, tamanho):
+    mensagem = bytes(tamanho)
+    for _ in range(n_mensagens):
+        fila.put(mensagem)
+
+def medir_vazao_entre_processos(n_mensagens=100_000, tamanho=64, capacidade_bytes=1 << 20):
+    """
+    Mede mensagens por segundo de um processo produtor para o processo atual
+    usando FilaMemoriaCompartilhada e multiprocessing.Queue. Retorna um
+    dicionário {nome da fila: mensagens/s}.
+    """
+    resultado = {}
+    fila = FilaMemoriaCompartilhada(capacidade_bytes)
+    try:
+        produtor = multiprocessing.Process(target=_produzir_em_memoria_compartilhada,
+                                           args=(fila, n_mensagens, tamanho))
+        inicio = time.perf_counter()
+        produtor.start()
+        for _ in range(n_mensagens):
+            fila.get()
+        resultado['FilaMemoriaCompartilhada'] = n_mensagens / (time.perf_counter() - inicio)
+        produtor.join()
+    finally:
+        fila.close()
+        fila.unlink()
+
+    fila_mp = multiprocessing.Queue(maxsize=max(1, capacidade_bytes // tamanho))
+    produtor = multiprocessing.Process(target=_produzir_em_multiprocessing_queue,
+                                       args=(fila_mp, n_mensagens, tamanho))
+    inicio = time.perf_counter()
+    produtor.start()
+    for _ in range(n_mensagens):
+        fila_mp.get()
+    resultado['multiprocessing.Queue'] = n_mensagens / (time.perf_counter() - inicio)
+    produtor.join()
+    return resultado
+
+# =============================================================================
+# FILA QUE TRANSBORDA PARA O DISCO
+# =============================================================================
+
+class FilaEmDisco(EstruturaLinear):
+    """
+    Fila FIFO para filas maiores que a memória: só o início (cabeça) e o fim
+    (cauda) ficam em memória, cada um em um DequeCircular de metade do limite
+    de itens; o meio fica em arquivos de segmento no disco.
+
+    Quando a cauda enche, ela é gravada de uma vez em um novo segmento
+    (arquivo só de acréscimo, com os itens serializados por pickle). Quando a
+    cabeça esvazia, o segmento mais antigo é lido sequencialmente para ela e
+    o arquivo é apagado. Assim, a memória fica limitada a limite_memoria
+    itens, qualquer que seja o tamanho da fila.
+
+    remove_item não reescreve segmentos: o item removido no disco é marcado
+    (posição no segmento) e pulado quando o segmento é lido.
+
+    Todo item é serializado ao entrar (um item que não pode ser gravado é
+    recusado na hora, esteja a fila em memória ou não), e a cauda guarda os
+    bytes já serializados, que vão direto para o segmento. Se a fila for
+    descartada sem close(), os segmentos são apagados quando ela é coletada.
+    """
+    def __init__(self, limite_memoria=10_000, diretorio=None):
+        """
+        :param limite_memoria: Máximo de itens em memória (cabeça + cauda).
+        :param diretorio: Onde gravar os segmentos (padrão: um diretório temporário,
+                          apagado por close()).
+        """
+        if limite_memoria < 2:
+            raise ValueError("O limite de memória deve ser de pelo menos 2 itens.")
+        self.itens_por_segmento = limite_memoria // 2
+        self._cabeca = DequeCircular(self.itens_por_segmento)
+        self._cauda = DequeCircular(self.itens_por_segmento)
+        self._segmentos = Fila()   # (caminho, quantidade de itens gravados), do mais antigo ao mais novo
+        self._removidos = {}       # caminho -> posições removidas por remove_item
+        self._temporario = diretorio is None
+        self.diretorio = tempfile.mkdtemp(prefix="fila_em_disco_") if diretorio is None else diretorio
+        self._proximo_segmento = 0
+        self._tamanho = 0
+        # Não referencia a fila: só o que é preciso para apagar os arquivos
+        self._finalizador = weakref.finalize(self, FilaEmDisco._apagar_arquivos,
+                                             self._segmentos, self.diretorio, self._temporario)
+
+    def __len__(self):
+        return self._tamanho
+
+    def enqueue(self, item):
+        """Adiciona um item ao final da fila (O(1) amortizado)."""
+        # Serializa antes de mexer na fila: um item que não pode ser gravado é recusado aqui
+        dados = pickle.dumps(item, pickle.HIGHEST_PROTOCOL)
+        if self._segmentos.is_empty() and self._cauda.is_empty() and not self._cabeca.is_full():
+            # Tudo ainda cabe na cabeça: o disco nem é usado
+            self._cabeca.push_back(item)
+        else:
+            self._cauda.push_back(dados)
+            if self._cauda.is_full():
+                try:
+                    self._despejar_cauda()
+                except BaseException:
+                    # Não deu para gravar (ex.: disco cheio): desfaz a inserção
+                    self._cauda.pop_back()
+                    raise
+        self._tamanho += 1
+
+    def _despejar_cauda(self):
+        """
+        Grava a cauda inteira (já serializada) em um novo segmento, em uma
+        escrita sequencial.
+
+        Os itens só saem da cauda depois que o arquivo foi gravado por inteiro;
+        se a gravação falhar, o arquivo parcial é apagado e a cauda fica intacta.
+        """
+        caminho = os.path.join(self.diretorio, f"segmento_{self._proximo_segmento:08d}.pkl")
+        n = len(self._cauda)
+        try:
+            with open(caminho, 'wb') as arquivo:
+                for dados in self._cauda:
+                    arquivo.write(dados)
+        except BaseException:
+            if os.path.exists(caminho):
+                os.remove(caminho)
+            raise
+        for _ in range(n):
+            self._cauda.pop()
+        self._proximo_segmento += 1
+        self._segmentos.enqueue((caminho, n))
+
+    @staticmethod
+    def _ler_segmento(caminho, n):
+        """Gera os n itens de um segmento, na ordem, com leitura sequencial."""
+        with open(caminho, 'rb', buffering=1 << 20) as arquivo:
+            for _ in range(n):
+                yield pickle.load(arquivo)
+
+    def _recarregar_cabeca(self):
+        """Com a cabeça vazia, traz o próximo segmento do disco (ou a cauda) para ela."""
+        while self._cabeca.is_empty():
+            if self._segmentos.is_empty():
+                # Sem segmentos: os itens da cauda passam para a cabeça
+                while not self._cauda.is_empty():
+                    self._cabeca.push_back(pickle.loads(self._cauda.pop()))
+                return
+            caminho, n = self._segmentos.dequeue()
+            removidos = self._removidos.pop(caminho, ())
+            for posicao, item in enumerate(self._ler_segmento(caminho, n)):
+                if posicao not in removidos:
+                    self._cabeca.push_back(item)
+            os.remove(caminho)
+
+    def dequeue(self):
+        """Remove e retorna o item do início da fila."""
+        if self.is_empty(): raise IndexError("Fila vazia (Queue underflow).")
+        if self._cabeca.is_empty():
+            self._recarregar_cabeca()
+        self._tamanho -= 1
+        return self._cabeca.pop()
+
+    def peek(self):
+        """Retorna o item do início da fila sem removê-lo."""
+        if self.is_empty(): raise IndexError("Fila vazia.")
+        if self._cabeca.is_empty():
+            self._recarregar_cabeca()
+        return self._cabeca.find_at(0)
+
+    def remove_item(self, item_to_remove):
+        """
+        Remove a primeira ocorrência do item (para desistências). Nos segmentos
+        em disco, lê o arquivo procurando o item e só marca a posição.
+        """
+        if self._cabeca.remove_first(item_to_remove):
+            self._tamanho -= 1
+            return True
+        for caminho, n in self._segmentos:
+            removidos = self._removidos.get(caminho, ())
+            for posicao, item in enumerate(self._ler_segmento(caminho, n)):
+                if posicao not in removidos and item == item_to_remove:
+                    self._removidos.setdefault(caminho, set()).add(posicao)
+                    self._tamanho -= 1
+                    return True
+        for dados in self._cauda:
+            if pickle.loads(dados) == item_to_remove:
+                # Bytes iguais são o mesmo item: remove_first acha exatamente esta posição
+                self._cauda.remove_first(dados)
+                self._tamanho -= 1
+                return True
+        return False
+
+    def __iter__(self):
+        """Percorre a fila do início ao fim, lendo os segmentos do disco sob demanda."""
+        yield from self._cabeca
+        for caminho, n in self._segmentos:
+            removidos = self._removidos.get(caminho, ())
+            for posicao, item in enumerate(self._ler_segmento(caminho, n)):
+                if posicao not in removidos:
+                    yield item
+        for dados in self._cauda:
+            yield pickle.loads(dados)
+
+    @staticmethod
+    def _apagar_arquivos(segmentos, diretorio, temporario):
+        """Apaga os segmentos restantes (e o diretório, se foi criado pela fila)."""
+        while not segmentos.is_empty():
+            caminho, _ = segmentos.dequeue()
+            if os.path.exists(caminho):
+                os.remove(caminho)
+        if temporario and os.path.isdir(diretorio):
+            os.rmdir(diretorio)
+
+    def close(self):
+        """Apaga os segmentos restantes (e o diretório, se foi criado pela fila)."""
+        self._finalizador()   # roda uma vez só; depois disso, a coleta da fila não apaga nada
+        self._removidos.clear()
+        self._cabeca = DequeCircular(self.itens_por_segmento)
+        self._cauda = DequeCircular(self.itens_por_segmento)
+        self._tamanho = 0
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    # --- Implementação dos métodos abstratos ---
+    def insert(self, item, **kwargs): self.enqueue(item)
+    def remove(self, **kwargs): return self.dequeue()
+    def find(self, **kwargs): return self.peek()
+    def __str__(self):
+        return (f"FilaEmDisco({self._tamanho} itens: {len(self._cabeca)} na cabeça, "
+                f"{len(self._segmentos)} segmento(s) em disco, {len(self._cauda)} na cauda)")
+
+# =============================================================================
+# RODA DE TEMPORIZAÇÃO HIERÁRQUICA (TIMING WHEEL)
+# =============================================================================
+
+class Temporizador:
+    """Handle de um prazo agendado em uma RodaDeTemporizacao."""
+    __slots__ = ('tick', 'callback', 'args', '_roda', '_balde', '_node', '_encerrado')
+
+    def __init__(self, roda, tick, callback, args):
+        self.tick = tick
+        self.callback = callback
+        self.args = args
+        self._roda = roda
+        self._balde = self._node = None
+        self._encerrado = False
+
+    @property
+    def ativo(self):
+        """True enquanto o temporizador não disparou nem foi cancelado."""
+        return not self._encerrado
+
+    def cancel(self):
+        """
+        Cancela o temporizador em O(1). Retorna False se ele já tinha
+        disparado ou sido cancelado.
+        """
+        if self._encerrado:
+            return False
+        self._encerrado = True
+        if self._node is not None:
+            self._balde.remove_node(self._node)
+            self._balde = self._node = None
+            self._roda._pendentes -= 1
+        # Sem nó: está no lote do tick atual, que o descontará ao passar por ele
+        return True
+
+class RodaDeTemporizacao:
+    """
+    Roda de temporização hierárquica: cada nível tem `slots` baldes
+    (ListaDuplamenteEncadeada de temporizadores); um balde do nível n cobre
+    slots**n ticks. Um prazo é colocado no nível mais baixo que o alcança e
+    desce de nível ("cascata") quando a roda de baixo dá a volta.
+
+    Agendar e cancelar custam O(1); avançar custa O(1) por tick mais os
+    temporizadores que disparam ou descem de nível. Todos os prazos de um
+    mesmo tick são disparados em lote, na ordem de agendamento. Se um
+    callback lançar uma exceção, ela sobe por avancar e os prazos que
+    faltavam no lote continuam agendados (disparam no próximo avancar).
+
+    O tempo é um número na unidade que o usuário quiser (ex: segundos); um
+    tick vale `resolucao` unidades, e um prazo dispara no primeiro tick que
+    não seja anterior a ele.
+    """
+    def __init__(self, resolucao=1.0, slots=64, niveis=4):
+        if resolucao <= 0 or slots < 2 or niveis < 1:
+            raise ValueError("Use resolucao > 0, slots >= 2 e niveis >= 1.")
+        self.resolucao = resolucao
+        self.slots = slots
+        self.niveis = niveis
+        self._rodas = [[ListaDuplamenteEncadeada() for _ in range(slots)] for _ in range(niveis)]
+        self._tick = 0
+        self._pendentes = 0
+
+    def __len__(self):
+        """Número de temporizadores pendentes."""
+        return self._pendentes
+
+    @property
+    def agora(self):
+        """Instante (na unidade do usuário) do último tick processado."""
+        return self._tick * self.resolucao
+
+    def agendar(self, prazo, callback, *args):
+        """
+        Agenda callback(*args) para o instante `prazo` (O(1)) e retorna um
+        Temporizador. Prazos já vencidos disparam no próximo tick.
+        """
+        tick = max(math.ceil(prazo / self.resolucao), self._tick + 1)
+        temporizador = Temporizador(self, tick, callback, args)
+        self._colocar(temporizador)
+        self._pendentes += 1
+        return temporizador
+
+    def agendar_em(self, atraso, callback, *args):
+        """Agenda callback(*args) para daqui a `atraso` unidades de tempo."""
+        return self.agendar(self.agora + atraso, callback, *args)
+
+    def _colocar(self, temporizador):
+        """Põe o temporizador no balde do nível mais baixo que alcança seu tick."""
+        delta = temporizador.tick - self._tick
+        nivel, alcance = 0, self.slots
+        while delta >= alcance and nivel < self.niveis - 1:
+            nivel += 1
+            alcance *= self.slots
+        # Além do alcance do último nível: fica no balde mais distante e é recolocado depois
+        tick = min(temporizador.tick, self._tick + alcance - 1)
+        balde = self._rodas[nivel][(tick // self.slots ** nivel) % self.slots]
+        temporizador._balde = balde
+        temporizador._node = balde.push_back(temporizador)
+
+    def _esvaziar(self, nivel, indice):
+        """Tira todos os temporizadores de um balde (que é trocado por um vazio)."""
+        balde = self._rodas[nivel][indice]
+        self._rodas[nivel][indice] = ListaDuplamenteEncadeada()
+        lote = list(balde)
+        for temporizador in lote:
+            temporizador._balde = temporizador._node = None
+        return lote
+
+    def _passo(self):
+        """Avança um tick: faz a cascata dos níveis de cima e dispara o balde do nível 0."""
+        self._tick += 1
+        t = self._tick
+        # Quantos níveis deram a volta neste tick (o nível n vira a cada slots**n ticks)
+        nivel = 1
+        while nivel < self.niveis and t % self.slots ** nivel == 0:
+            nivel += 1
+        for n in range(nivel - 1, 0, -1):
+            for temporizador in self._esvaziar(n, (t // self.slots ** n) % self.slots):
+                self._colocar(temporizador)
+
+        disparados = 0
+        lote = self._esvaziar(0, t % self.slots)
+        i = 0
+        try:
+            while i < len(lote):
+                temporizador = lote[i]
+                i += 1
+                if temporizador._encerrado:
+                    # Cancelado por outro callback deste mesmo lote
+                    self._pendentes -= 1
+                    continue
+                if temporizador.tick > t:
+                    # Prazo além do alcance do último nível: ainda não venceu, recoloca
+                    self._colocar(temporizador)
+                    continue
+                self._pendentes -= 1
+                temporizador._encerrado = True
+                temporizador.callback(*temporizador.args)
+                disparados += 1
+        finally:
+            if i < len(lote):
+                # Um callback lançou exceção: o resto do lote volta para o balde e o
+                # tick volta um passo, para ser refeito no próximo avancar
+                balde = self._rodas[0][t % self.slots]
+                for temporizador in lote[i:]:
+                    if temporizador._encerrado:
+                        self._pendentes -= 1
+                    else:
+                        temporizador._balde = balde
+                        temporizador._node = balde.push_back(temporizador)
+                self._tick = t - 1
+        return disparados
+
+    def avancar(self, ate):
+        """
+        Processa todos os ticks até o instante `ate`, disparando os prazos
+        vencidos em lotes por tick. Retorna quantos temporizadores dispararam.
+        """
+        alvo = math.floor(ate / self.resolucao)
+        disparados = 0
+        while self._tick < alvo:
+            if self._pendentes == 0:
+                # Roda vazia: não há o que percorrer até o alvo
+                self._tick = alvo
+                break
+            disparados += self._passo()
+        return disparados
+
+# =============================================================================
+# RESOLUÇÃO DOS PROBLEMAS
+# =============================================================================
+
+class FilaDePrioridades(ListaDuplamenteEncadeada):
+    """
+    Implementação de uma Fila de Prioridades.
+    Herda da Lista Duplamente Encadeada e insere os itens de forma ordenada.
+    """
+    def __init__(self, key=lambda x: x['prioridade']):
+        super().__init__()
+        self.key = key
+
+    def insert_ordered(self, item):
+        """
+        Insere um item mantendo a ordem de prioridade (menor para maior).
+        Itens de mesma prioridade ficam na ordem de chegada (FIFO).
+        """
+        chave = self.key(item)
+        if self.is_empty() or chave < self.key(self._head.data):
+            self.push(item)
+        elif chave >= self.key(self._tail.data):
+            self.push_back(item)
+        else:
+            new_node = DoubleNode(item)
+            new_node.owner = self._owner
+            current = self._head
+            while self.key(current.data) <= chave:
+                current = current.next
+
+            new_node.next = current
+            new_node.prev = current.prev
+            current.prev.next = new_node
+            current.prev = new_node
+            self._size += 1
+            self._finger = None
+
+    def get_highest_priority(self):
+        """Retorna o item de maior prioridade (o primeiro da lista)."""
+        return self.pop()
+
+class HandleDePrioridade:
+    """
+    Referência a um item inserido em uma FilaDePrioridadesHeap.
+    Permite alterar a prioridade ou cancelar o item sem procurá-lo na fila.
+    """
+    __slots__ = ('item', 'chave', '_ordem', '_index', '_fila')
+
+    def __init__(self, item, chave, ordem, fila):
+        self.item = item
+        self.chave = chave
+        self._ordem = ordem      # desempate FIFO entre chaves iguais
+        self._index = -1         # posição no heap (-1 quando fora da fila)
+        self._fila = fila
+
+    def ativo(self):
+        """Indica se o item ainda está na fila."""
+        return self._index >= 0
+
+    def change_priority(self, nova_chave=None):
+        """Atalho para fila.change_priority(self, nova_chave)."""
+        self._fila.change_priority(self, nova_chave)
+
+    def cancel(self):
+        """Atalho para fila.cancel(self)."""
+        return self._fila.cancel(self)
+
+    def __lt__(self, outro):
+        return (self.chave, self._ordem) < (outro.chave, outro._ordem)
+
+    def __repr__(self):
+        return f"HandleDePrioridade(item={self.item}, chave={self.chave})"
+
+class FilaDePrioridadesHeap(EstruturaLinear):
+    """
+    Fila de Prioridades baseada em um heap binário de mínimo.
+    Mesma interface da FilaDePrioridades (insert_ordered/get_highest_priority),
+    mas com inserção e remoção em O(log n).
+
+    A chave de cada item é calculada uma única vez, na inserção. Itens com a
+    mesma chave saem na ordem de chegada (FIFO). insert_ordered retorna um
+    HandleDePrioridade, que permite change_priority e cancel em O(log n).
+    """
+    def __init__(self, key=lambda x: x['prioridade']):
+        self.key = key
+        self._heap = []
+        self._contador = 0
+
+    def __len__(self):
+        return len(self._heap)
+
+    # --- Manutenção do heap ---
+    def _place(self, handle, index):
+        self._heap[index] = handle
+        handle._index = index
+
+    def _sift_up(self, index):
+        handle = self._heap[index]
+        while index > 0:
+            pai = (index - 1) // 2
+            if not handle < self._heap[pai]: break
+            self._place(self._heap[pai], index)
+            index = pai
+        self._place(handle, index)
+
+    def _sift_down(self, index):
+        handle = self._heap[index]
+        n = len(self._heap)
+        while True:
+            filho = 2 * index + 1
+            if filho >= n: break
+            if filho + 1 < n and self._heap[filho + 1] < self._heap[filho]:
+                filho += 1
+            if not self._heap[filho] < handle: break
+            self._place(self._heap[filho], index)
+            index = filho
+        self._place(handle, index)
+
+    def _remove_at(self, index):
+        """Remove o handle na posição index do heap e o retorna."""
+        handle = self._heap[index]
+        ultimo = self._heap.pop()
+        if ultimo is not handle:
+            self._place(ultimo, index)
+            self._sift_down(index)
+            self._sift_up(ultimo._index)
+        handle._index = -1
+        return handle
+
+    def _next_ordem(self):
+        self._contador += 1
+        return self._contador
+
+    # --- Interface da fila de prioridades ---
+    def insert_ordered(self, item):
+        """Insere um item (O(log n)) e retorna o seu handle."""
+        handle = HandleDePrioridade(item, self.key(item), self._next_ordem(), self)
+        self._heap.append(handle)
+        self._sift_up(len(self._heap) - 1)
+        return handle
+
+    def get_highest_priority(self):
+        """Remove e retorna o item de maior prioridade (menor chave)."""
+        if self.is_empty(): raise IndexError("Remoção de uma fila vazia (underflow).")
+        return self._remove_at(0).item
+
+    def peek(self):
+        """Retorna o item de maior prioridade sem removê-lo."""
+        if self.is_empty(): raise IndexError("Fila vazia.")
+        return self._heap[0].item
+
+    def change_priority(self, handle, nova_chave=None):
+        """
+        Altera a chave de um item ainda na fila (O(log n)). Se nova_chave for None,
+        a chave é recalculada a partir do item (útil depois de alterá-lo).
+        O item passa a ser o último entre os de mesma chave, como numa nova inserção.
+        Lança um ValueError se o handle não estiver mais na fila.
+        """
+        if handle._fila is not self or not handle.ativo():
+            raise ValueError("O item não está nesta fila.")
+        handle.chave = self.key(handle.item) if nova_chave is None else nova_chave
+        handle._ordem = self._next_ordem()
+        self._sift_down(handle._index)
+        self._sift_up(handle._index)
+
+    def cancel(self, handle):
+        """
+        Remove um item da fila pelo handle (O(log n)).
+        Retorna False se o item já tinha saído da fila.
+        """
+        if handle._fila is not self or not handle.ativo():
+            return False
+        self._remove_at(handle._index)
+        return True
+
+    def __iter__(self):
+        """Percorre os itens em ordem de prioridade (sem removê-los)."""
+        for handle in sorted(self._heap):
+            yield handle.item
+
+    # --- Implementação dos métodos abstratos ---
+    def insert(self, item, **kwargs): return self.insert_ordered(item)
+    def remove(self, **kwargs): return self.get_highest_priority()
+    def find(self, **kwargs): return self.peek()
+    def __str__(self):
+        return f"FilaDePrioridadesHeap: [{', '.join(str(item) for item in self)}]"
+
+class FilaDePrioridadesBaldes(EstruturaLinear):
+    """
+    Fila de Prioridades por baldes (bucket queue), para prioridades inteiras
+    pequenas e não negativas (ex: {'prioridade': 1}).
+
+    Mantém uma Fila (FIFO) por nível de prioridade e um bitmap com os níveis
+    não vazios: o bit menos significativo ligado indica o nível a atender.
+    insert_ordered é O(1) e get_highest_priority é O(1) amortizado.
+    """
+    def __init__(self, key=lambda x: x['prioridade'], niveis=8):
+        """
+        Construtor da fila.
+        :param key: Função que extrai a prioridade (int >= 0) de um item.
+        :param niveis: Quantidade de níveis pré-alocados (cresce se necessário).
+        """
+        self.key = key
+        self._baldes = [Fila() for _ in range(niveis)]
+        self._bitmap = 0
+        self._size = 0
+
+    def __len__(self):
+        return self._size
+
+    def _menor_nivel(self):
+        """Índice do menor nível não vazio (bit menos significativo do bitmap)."""
+        return (self._bitmap & -self._bitmap).bit_length() - 1
+
+    def insert_ordered(self, item):
+        """
+        Insere um item no balde da sua prioridade (O(1)).
+        Lança um ValueError se a prioridade não for um inteiro não negativo.
+        """
+        nivel = self.key(item)
+        if not isinstance(nivel, int) or nivel < 0:
+            raise ValueError("A fila por baldes aceita apenas prioridades inteiras não negativas.")
+        while nivel >= len(self._baldes):
+            self._baldes.append(Fila())
+        self._baldes[nivel].enqueue(item)
+        self._bitmap |= 1 << nivel
+        self._size += 1
+
+    def get_highest_priority(self):
+        """Remove e retorna o item mais antigo do menor nível de prioridade."""
+        if self.is_empty(): raise IndexError("Remoção de uma fila vazia (underflow).")
+        nivel = self._menor_nivel()
+        balde = self._baldes[nivel]
+        item = balde.dequeue()
+        if balde.is_empty():
+            self._bitmap &= ~(1 << nivel)
+        self._size -= 1
+        return item
+
+    def peek(self):
+        """Retorna o item de maior prioridade sem removê-lo."""
+        if self.is_empty(): raise IndexError("Fila vazia.")
+        return self._baldes[self._menor_nivel()].peek()
+
+    def __iter__(self):
+        """Percorre os itens em ordem de prioridade (sem removê-los)."""
+        for balde in self._baldes:
+            yield from balde
+
+    # --- Implementação dos métodos abstratos ---
+    def insert(self, item, **kwargs): self.insert_ordered(item)
+    def remove(self, **kwargs): return self.get_highest_priority()
+    def find(self, **kwargs): return self.peek()
+    def __str__(self):
+        return f"FilaDePrioridadesBaldes: [{', '.join(str(item) for item in self)}]"
+
+def nova_fila_de_prioridades(modo='lista', key=lambda x: x['prioridade'], **kwargs):
+    """
+    Cria uma fila de prioridades com o mecanismo escolhido:
+    - 'lista': FilaDePrioridades (lista duplamente encadeada ordenada);
+    - 'heap': FilaDePrioridadesHeap (heap binário com handles);
+    - 'baldes': FilaDePrioridadesBaldes (um balde por prioridade inteira).
+    Todas oferecem insert_ordered/get_highest_priority com desempate FIFO.
+    """
+    modos = {'lista': FilaDePrioridades, 'heap': FilaDePrioridadesHeap, 'baldes': FilaDePrioridadesBaldes}
+    if modo not in modos:
+        raise ValueError(f"Modo '{modo}' desconhecido. Use um de: {', '.join(modos)}.")
+    return modos[modo](key=key, **kwargs)
+
+class ArvoreFenwick:
+    """
+    Árvore de Fenwick (Binary Indexed Tree) sobre uma sequência que só cresce
+    no fim. Permite somar um prefixo e alterar um valor em O(log n).
+    Os índices externos começam em 0.
+    """
+    def __init__(self, valores=()):
+        """Constrói a árvore já com os valores dados, em O(n)."""
+        self._tree = [0]
+        self._tree.extend(valores)
+        n = len(self._tree) - 1
+        for i in range(1, n + 1):
+            pai = i + (i & -i)
+            if pai <= n:
+                self._tree[pai] += self._tree[i]
+
+    def __len__(self):
+        return len(self._tree) - 1
+
+    def append(self, valor):
+        """Acrescenta um valor no fim da sequência (O(log n))."""
+        i = len(self._tree)
+        # O nó i cobre o intervalo (i - lowbit(i), i]: soma dos anteriores desse intervalo
+        self._tree.append(valor + self._prefix(i - 1) - self._prefix(i - (i & -i)))
+
+    def add(self, index, delta):
+        """Soma delta ao valor na posição index (O(log n))."""
+        i = index + 1
+        while i < len(self._tree):
+            self._tree[i] += delta
+            i += i & -i
+
+    def _prefix(self, i):
+        total = 0
+        while i > 0:
+            total += self._tree[i]
+            i -= i & -i
+        return total
+
+    def prefix_sum(self, index):
+        """Soma dos valores nas posições 0..index, inclusive (O(log n))."""
+        return self._prefix(index + 1)
+
+    def total(self):
+        return self._prefix(len(self._tree) - 1)
+
+    def clear(self):
+        self._tree = [0]
+
+class FilaBandejao:
+    """
+    Simulação do problema da fila do bandejão.
+
+    Os horários estimados não são reescritos a cada evento: cada usuário ocupa
+    uma posição de chegada em duas árvores de Fenwick (tempo de atendimento e
+    presença). O horário estimado é calculado sob demanda como
+    referência + soma dos tempos de quem está à frente (inclusive o próprio),
+    onde a referência é o início do atendimento atual. Atender e desistir
+    custam O(log n). Quando as posições de quem já saiu passam das de quem
+    está na fila, as árvores são refeitas só com os presentes (O(n), mas
+    amortizado entre as saídas), então elas não crescem com o total de
+    chegadas.
+
+    O relógio é injetável (qualquer função que retorne um datetime), o que
+    permite rodar a fila em tempo virtual (ver SimulacaoBandejao), e as
+    mensagens podem ser desligadas com verbose=False.
+
+    Cada usuário pode ter uma paciência (em minutos): os prazos ficam em uma
+    RodaDeTemporizacao de 1 segundo por tick, e quem passa do prazo sem ser
+    atendido sai da fila sozinho. Os prazos vencidos são processados, em lote,
+    a cada operação na fila (ou chamando processar_desistencias).
+    """
+    class Usuario:
+        def __init__(self, nome, id_usuario, tempo_atendimento=None):
+            self.nome = nome
+            self.id = id_usuario
+            self.tempo_atendimento = tempo_atendimento
+            self._fila = None
+            self._slot = None
+            self._hora_fixa = None
+
+        @property
+        def hora_estimada_atendimento(self):
+            """Horário estimado de retirada (calculado na hora enquanto o usuário está na fila)."""
+            if self._fila is not None:
+                return self._fila.hora_estimada(self)
+            return self._hora_fixa
+
+        def __repr__(self): return f"Usuario({self.nome}, ID:{self.id})"
+
+    def __init__(self, tempo_medio_atendimento_min=2, relogio=datetime.datetime.now, verbose=True,
+                 paciencia_min=None):
+        self._roda = RodaDeTemporizacao(resolucao=1.0)   # segundos desde a criação da fila
+        self.fila_de_pedidos = Fila(indexar=True, roda=self._roda, ao_expirar=self._desistiu_por_tempo)
+        self.relogio = relogio
+        self.verbose = verbose
+        self.tempo_medio_atendimento = datetime.timedelta(minutes=tempo_medio_atendimento_min)
+        self.paciencia_min = paciencia_min
+        self._inicio = relogio()
+        self.proximo_id = 1
+        self._tempos = ArvoreFenwick()     # segundos de atendimento por posição de chegada
+        self._presenca = ArvoreFenwick()   # 1 se o usuário ainda está na fila, 0 se saiu
+        self._referencia = None            # início do atendimento do primeiro da fila
+        self._ocupado_ate = None           # fim do atendimento de quem veio de outra fila (ver atender_transferido)
+
+    def estimar_tempo_espera(self):
+        """Tempo total para atender todos que estão na fila (mais o atendimento em curso de um transferido)."""
+        espera = datetime.timedelta(seconds=self._tempos.total())
+        if self._ocupado_ate is not None:
+            inicio = self._referencia if not self.fila_de_pedidos.is_empty() else self._ocupado_ate
+            espera += max(inicio - self.relogio(), datetime.timedelta(0))
+        return espera
+
+    def ocupacao(self):
+        """Pessoas no balcão: as da fila mais quem veio de outra fila e ainda está sendo atendido."""
+        em_atendimento = self._ocupado_ate is not None and self._ocupado_ate > self.relogio()
+        return len(self.fila_de_pedidos) + em_atendimento
+
+    def atender_transferido(self, usuario):
+        """
+        Começa a atender agora um usuário que saiu de outra fila (roubo de
+        trabalho). O balcão fica ocupado até o fim desse atendimento: quem
+        entrar na fila em seguida tem o horário estimado a partir dali.
+        """
+        fim = self.relogio() + datetime.timedelta(seconds=self._segundos_atendimento(usuario))
+        self._ocupado_ate = fim
+        usuario._hora_fixa = fim
+        return usuario
+
+    def posicao(self, usuario):
+        """Posição (1 = próximo a ser atendido) de um usuário na fila (O(log n))."""
+        return self._presenca.prefix_sum(usuario._slot)
+
+    def hora_estimada(self, usuario):
+        """Horário estimado de retirada de um usuário na fila (O(log n))."""
+        return self._referencia + datetime.timedelta(seconds=self._tempos.prefix_sum(usuario._slot))
+
+    def _sair(self, usuario):
+        """Tira o usuário das árvores, congelando sua última estimativa."""
+        usuario._hora_fixa = self.hora_estimada(usuario)
+        self._tempos.add(usuario._slot, -self._segundos_atendimento(usuario))
+        self._presenca.add(usuario._slot, -1)
+        usuario._fila = usuario._slot = None
+        if len(self._tempos) > 2 * len(self.fila_de_pedidos) + 16:
+            self._compactar()
+
+    def _compactar(self):
+        """Refaz as árvores só com quem está na fila, renumerando as posições de chegada (O(n))."""
+        usuarios = list(self.fila_de_pedidos)
+        for slot, usuario in enumerate(usuarios):
+            usuario._slot = slot
+        self._tempos = ArvoreFenwick(self._segundos_atendimento(u) for u in usuarios)
+        self._presenca = ArvoreFenwick(1 for _ in usuarios)
+
+    def _segundos_atendimento(self, usuario):
+        tempo = usuario.tempo_atendimento
+        if tempo is None:
+            tempo = self.tempo_medio_atendimento
+        return tempo.total_seconds()
+
+    def _segundos_desde_inicio(self, momento):
+        return (momento - self._inicio).total_seconds()
+
+    def processar_desistencias(self):
+        """Tira da fila quem passou do prazo de paciência. Retorna quantos saíram."""
+        if not len(self._roda):
+            # Nenhum prazo pendente: nem consulta o relógio
+            return 0
+        return self._roda.avancar(self._segundos_desde_inicio(self.relogio()))
+
+    def _desistiu_por_tempo(self, usuario):
+        """Chamado pela fila quando o prazo de paciência do usuário vence."""
+        self._sair(usuario)
+        if self.verbose: print(f"\n!! {usuario.nome} cansou de esperar e saiu da fila.")
+
+    def entrar_na_fila(self, nome_usuario, tempo_atendimento_min=None, paciencia_min=None):
+        """
+        Coloca um usuário no fim da fila.
+        :param tempo_atendimento_min: Estimativa de atendimento deste usuário
+                                      (padrão: o tempo médio da fila).
+        :param paciencia_min: Tempo máximo que o usuário espera antes de desistir
+                              (padrão: a paciência da fila; None: espera sempre).
+        """
+        self.processar_desistencias()
+        agora = self.relogio()
+        if self.fila_de_pedidos.is_empty():
+            # Com um transferido ainda em atendimento, a fila só começa quando ele terminar
+            ocupado = self._ocupado_ate is not None and self._ocupado_ate > agora
+            self._referencia = self._ocupado_ate if ocupado else agora
+        tempo = None if tempo_atendimento_min is None else datetime.timedelta(minutes=tempo_atendimento_min)
+        usuario = self.Usuario(nome_usuario, self.proximo_id, tempo)
+        self.proximo_id += 1
+        usuario._fila = self
+        usuario._slot = len(self._tempos)
+        self._tempos.append(self._segundos_atendimento(usuario))
+        self._presenca.append(1)
+        if paciencia_min is None:
+            paciencia_min = self.paciencia_min
+        prazo = None
+        if paciencia_min is not None:
+            # A roda pode ter ficado parada enquanto estava vazia: leva-a até agora
+            self._roda.avancar(self._segundos_desde_inicio(agora))
+            prazo = self._segundos_desde_inicio(agora) + paciencia_min * 60
+        self.fila_de_pedidos.enqueue(usuario, prazo=prazo)
+        if self.verbose: print(f"\n>> {usuario.nome} entrou na fila. Posição: {len(self.fila_de_pedidos)}, Retirada às: {usuario.hora_estimada_atendimento.strftime('%H:%M:%S')}")
+        return usuario
+
+    def atender_proximo(self):
+        self.processar_desistencias()
+        if self.fila_de_pedidos.is_empty():
+            if self.verbose: print("\nFila vazia. Ninguém para atender.")
+            return None
+        usuario_atendido = self.fila_de_pedidos.dequeue()
+        self._sair(usuario_atendido)
+        # O próximo começa a ser atendido agora
+        self._referencia = self.relogio()
+        if self.verbose: print(f"\n<< {usuario_atendido.nome} foi atendido.")
+        return usuario_atendido
+
+    def desistir(self, usuario):
+        """Remove um usuário que desistiu. Retorna True se ele estava na fila."""
+        self.processar_desistencias()
+        if self.fila_de_pedidos.remove_item(usuario):
+            self._sair(usuario)
+            if self.verbose: print(f"\n!! {usuario.nome} desistiu e foi removido da fila.")
+            return True
+        if self.verbose: print(f"\n!! {usuario.nome} não encontrado na fila.")
+        return False
+
+    def atualizar_tempos_todos(self):
+        """Mostra os horários estimados de todos na fila (calculados sob demanda)."""
+        print("   -- Tempos de espera de todos na fila --")
+        for usuario in self.fila_de_pedidos:
+            print(f"      - {usuario.nome}: Horário estimado {usuario.hora_estimada_atendimento.strftime('%H:%M:%S')}")
+
+    def visualizar_fila(self):
+        self.processar_desistencias()
+        print("\n--- Fila do Bandejão Atual ---")
+        if self.fila_de_pedidos.is_empty():
+            print("A fila está vazia.")
+            return
+        for i, usuario in enumerate(self.fila_de_pedidos):
+            print(f"{i+1}. {usuario.nome} - Retirada às: {usuario.hora_estimada_atendimento.strftime('%H:%M:%S')}")
+        print("----------------------------")
+
+# =============================================================================
+# BANDEJÃO COM VÁRIOS BALCÕES
+# =============================================================================
+
+class BandejaoMultiBalcao:
+    """
+    Bandejão com vários balcões de atendimento, cada um com sua própria
+    FilaBandejao e seu próprio tempo médio de atendimento.
+
+    Políticas de distribuição das chegadas:
+    - 'round_robin': balcões em rodízio;
+    - 'menor_fila': a fila com menos pessoas (empate: menor espera estimada);
+    - 'duas_escolhas': sorteia dois balcões e escolhe a menor das duas filas.
+    Com roubo_de_trabalho=True, um balcão sem fila atende o último usuário da
+    fila mais longa, em vez de ficar ocioso.
+    """
+    POLITICAS = ('round_robin', 'menor_fila', 'duas_escolhas')
+
+    def __init__(self, tempos_medios_min=(2, 2), politica='menor_fila', roubo_de_trabalho=True,
+                 relogio=datetime.datetime.now, verbose=True, seed=None):
+        if politica not in self.POLITICAS:
+            raise ValueError(f"Política '{politica}' desconhecida. Use uma de: {', '.join(self.POLITICAS)}.")
+        if not tempos_medios_min:
+            raise ValueError("O bandejão precisa de pelo menos um balcão.")
+        self.balcoes = [FilaBandejao(t, relogio=relogio, verbose=False) for t in tempos_medios_min]
+        self.politica = politica
+        self.roubo_de_trabalho = roubo_de_trabalho
+        self.verbose = verbose
+        self.proximo_id = 1
+        self._rng = random.Random(seed)
+        self._proximo_rodizio = 0
+        # Capacidade total em atendimentos por minuto (soma das taxas dos balcões)
+        self._taxa_total = sum(1 / b.tempo_medio_atendimento.total_seconds() for b in self.balcoes) * 60
+
+    def __len__(self):
+        return sum(len(b.fila_de_pedidos) for b in self.balcoes)
+
+    def estimar_tempo_espera(self):
+        """
+        Espera estimada considerando todos os balcões juntos: pessoas na fila
+        divididas pela capacidade total de atendimento.
+        """
+        return datetime.timedelta(minutes=len(self) / self._taxa_total)
+
+    def _escolher_balcao(self):
+        if self.politica == 'round_robin':
+            i = self._proximo_rodizio
+            self._proximo_rodizio = (i + 1) % len(self.balcoes)
+            return i
+        if self.politica == 'menor_fila':
+            candidatos = range(len(self.balcoes))
+        else:
+            candidatos = self._rng.sample(range(len(self.balcoes)), min(2, len(self.balcoes)))
+        return min(candidatos, key=lambda i: (self.balcoes[i].ocupacao(),
+                                              self.balcoes[i].estimar_tempo_espera()))
+
+    def entrar_na_fila(self, nome_usuario, tempo_atendimento_min=None):
+        """Coloca um usuário na fila do balcão escolhido pela política."""
+        i = self._escolher_balcao()
+        usuario = self.balcoes[i].entrar_na_fila(nome_usuario, tempo_atendimento_min)
+        usuario.id = self.proximo_id
+        usuario.balcao = i
+        self.proximo_id += 1
+        if self.verbose:
+            print(f"\n>> {usuario.nome} entrou na fila do balcão {i + 1}. Posição: {self.balcoes[i].posicao(usuario)}, Retirada às: {usuario.hora_estimada_atendimento.strftime('%H:%M:%S')}")
+        return usuario
+
+    def atender_proximo(self, balcao):
+        """
+        O balcão informado (índice a partir de 0) atende o primeiro da sua fila.
+        Se a fila dele estiver vazia e o roubo de trabalho estiver ligado,
+        atende o último da fila mais longa: o balcão fica ocupado até o fim
+        desse atendimento, o que entra nas estimativas e na escolha de balcão.
+        """
+        fila = self.balcoes[balcao]
+        if fila.fila_de_pedidos.is_empty() and self.roubo_de_trabalho:
+            vitima = max(self.balcoes, key=lambda b: len(b.fila_de_pedidos))
+            if len(vitima.fila_de_pedidos) > 1:
+                usuario = vitima.fila_de_pedidos.peek_back()
+                vitima.desistir(usuario)
+                fila.atender_transferido(usuario)
+                usuario.balcao = balcao
+                if self.verbose:
+                    print(f"\n<< {usuario.nome} foi atendido no balcão {balcao + 1} (vindo de outra fila).")
+                return usuario
+        usuario = fila.atender_proximo()
+        if self.verbose:
+            if usuario is None: print(f"\nBalcão {balcao + 1}: fila vazia. Ninguém para atender.")
+            else: print(f"\n<< {usuario.nome} foi atendido no balcão {balcao + 1}.")
+        return usuario
+
+    def desistir(self, usuario):
+        """Remove um usuário que desistiu da fila do seu balcão."""
+        saiu = self.balcoes[usuario.balcao].desistir(usuario)
+        if self.verbose:
+            if saiu: print(f"\n!! {usuario.nome} desistiu e foi removido da fila do balcão {usuario.balcao + 1}.")
+            else: print(f"\n!! {usuario.nome} não encontrado na fila.")
+        return saiu
+
+    def visualizar_fila(self):
+        for i, balcao in enumerate(self.balcoes):
+            print(f"\n--- Balcão {i + 1} ({balcao.tempo_medio_atendimento.total_seconds() / 60:g} min/atendimento) ---")
+            if balcao.fila_de_pedidos.is_empty():
+                print("A fila está vazia.")
+                continue
+            for j, usuario in enumerate(balcao.fila_de_pedidos):
+                print(f"{j+1}. {usuario.nome} - Retirada às: {usuario.hora_estimada_atendimento.strftime('%H:%M:%S')}")
+        print("----------------------------")
+
+# =============================================================================
+# SIMULAÇÃO DE EVENTOS DISCRETOS DA FILA DO BANDEJÃO
+# =============================================================================
+
+class RelogioVirtual:
+    """Relógio de simulação: só avança quando o motor de eventos manda."""
+    def __init__(self, inicio=datetime.datetime(2000, 1, 1, 11, 0)):
+        self.inicio = inicio
+        self.minutos = 0.0
+
+    def agora(self):
+        """Horário virtual atual (compatível com datetime.datetime.now)."""
+        return self.inicio + datetime.timedelta(minutes=self.minutos)
+
+    def avancar_para(self, minutos):
+        if minutos < self.minutos:
+            raise ValueError("O relógio virtual não pode voltar no tempo.")
+        self.minutos = minutos
+
+def exponencial(media_min):
+    """Distribuição exponencial com a média informada (em minutos)."""
+    return lambda rng: rng.expovariate(1.0 / media_min)
+
+def constante(valor_min):
+    """Distribuição degenerada: sempre o mesmo valor (em minutos)."""
+    return lambda rng: valor_min
+
+class SimulacaoBandejao:
+    """
+    Simulação de eventos discretos do bandejão em tempo virtual.
+
+    Um calendário de eventos (FilaDePrioridadesHeap ordenada pelo instante)
+    dispara chegadas, fins de atendimento e desistências; as filas usam um
+    RelogioVirtual, então um dia inteiro roda em segundos e sem mensagens.
+    O bandejão simulado é um BandejaoMultiBalcao (sem roubo de trabalho),
+    com um único balcão por padrão.
+    As distribuições são funções rng -> minutos (ex: exponencial(2)), e a
+    semente torna cada execução reprodutível.
+    """
+    CHEGADA, FIM_ATENDIMENTO, DESISTENCIA = 0, 1, 2
+
+    def __init__(self, chegadas, atendimento, paciencia=None, seed=None,
+                 tempo_medio_atendimento_min=2, registrar_serie=False,
+                 n_balcoes=1, politica='menor_fila'):
+        """
+        :param chegadas: Distribuição do intervalo entre chegadas.
+        :param atendimento: Distribuição do tempo real de atendimento.
+        :param paciencia: Distribuição do tempo até desistir (None: ninguém desiste).
+        :param seed: Semente do gerador aleatório.
+        :param tempo_medio_atendimento_min: Estimativa usada pela fila nos horários previstos.
+        :param registrar_serie: Guarda a série (minuto, tamanho da fila) a cada mudança.
+        :param n_balcoes: Número de balcões (todos com o mesmo tempo médio).
+        :param politica: Política de distribuição entre os balcões.
+        """
+        self.chegadas = chegadas
+        self.atendimento = atendimento
+        self.paciencia = paciencia
+        self.rng = random.Random(seed)
+        self.relogio = RelogioVirtual()
+        self.bandejao = BandejaoMultiBalcao((tempo_medio_atendimento_min,) * n_balcoes, politica=politica,
+                                            roubo_de_trabalho=False, relogio=self.relogio.agora,
+                                            verbose=False, seed=self.rng.random())
+        self.registrar_serie = registrar_serie
+        self._eventos = FilaDePrioridadesHeap(key=lambda evento: evento[0])
+        self._chegada = {}   # id do usuário -> minuto de chegada
+
+    def _agendar(self, minutos, tipo, usuario=None):
+        return self._eventos.insert_ordered((minutos, tipo, usuario))
+
+    def _iniciar_atendimento(self, agora, usuario, esperas, desistencias_agendadas):
+        """O usuário chegou à frente: registra a espera e agenda o fim do atendimento."""
+        esperas.append(agora - self._chegada[usuario.id])
+        handle = desistencias_agendadas.pop(usuario.id, None)
+        if handle is not None:
+            handle.cancel()
+        self._agendar(agora + self.atendimento(self.rng), self.FIM_ATENDIMENTO, usuario)
+
+    def executar(self, n_clientes=None, duracao_min=None):
+        """
+        Roda a simulação até n_clientes chegarem ou até duracao_min (o que vier
+        primeiro) e depois esvazia a fila. Retorna um dicionário de estatísticas.
+        """
+        if n_clientes is None and duracao_min is None:
+            raise ValueError("Informe n_clientes e/ou duracao_min.")
+        bandejao = self.bandejao
+        esperas = array.array('d')
+        desistencias_agendadas = {}
+        serie = [] if self.registrar_serie else None
+        chegados = desistencias = 0
+        area_fila = fila_maxima = 0
+        ultimo_instante = 0.0
+
+        self._agendar(self.chegadas(self.rng), self.CHEGADA)
+        while not self._eventos.is_empty():
+            agora, tipo, usuario = self._eventos.get_highest_priority()
+            # Integral do tamanho da fila no tempo (para a média ponderada)
+            area_fila += len(bandejao) * (agora - ultimo_instante)
+            ultimo_instante = agora
+            self.relogio.avancar_para(agora)
+
+            if tipo == self.CHEGADA:
+                if duracao_min is not None and agora > duracao_min:
+                    continue
+                chegados += 1
+                usuario = bandejao.entrar_na_fila(f"Cliente {chegados}")
+                self._chegada[usuario.id] = agora
+                if len(bandejao.balcoes[usuario.balcao].fila_de_pedidos) == 1:
+                    self._iniciar_atendimento(agora, usuario, esperas, desistencias_agendadas)
+                elif self.paciencia is not None:
+                    desistencias_agendadas[usuario.id] = self._agendar(
+                        agora + self.paciencia(self.rng), self.DESISTENCIA, usuario)
+                if n_clientes is None or chegados < n_clientes:
+                    self._agendar(agora + self.chegadas(self.rng), self.CHEGADA)
+            elif tipo == self.FIM_ATENDIMENTO:
+                bandejao.atender_proximo(usuario.balcao)
+                del self._chegada[usuario.id]
+                fila = bandejao.balcoes[usuario.balcao].fila_de_pedidos
+                if not fila.is_empty():
+                    self._iniciar_atendimento(agora, fila.peek(), esperas, desistencias_agendadas)
+            else:
+                del desistencias_agendadas[usuario.id]
+                bandejao.desistir(usuario)
+                del self._chegada[usuario.id]
+                desistencias += 1
+
+            tamanho = len(bandejao)
+            fila_maxima = max(fila_maxima, tamanho)
+            if serie is not None and (not serie or serie[-1][1] != tamanho):
+                serie.append((agora, tamanho))
+
+        resultado = {
+            'chegadas': chegados,
+            'atendidos': len(esperas),
+            'desistencias': desistencias,
+            'duracao_min': ultimo_instante,
+            'espera_media_min': sum(esperas) / len(esperas) if esperas else 0.0,
+            'espera_p95_min': self._percentil(esperas, 0.95),
+            'fila_media': area_fila / ultimo_instante if ultimo_instante else 0.0,
+            'fila_maxima': fila_maxima,
+            'vazao_por_hora': 60 * len(esperas) / ultimo_instante if ultimo_instante else 0.0,
+        }
+        if serie is not None:
+            resultado['serie'] = serie
+        return resultado
+
+    @staticmethod
+    def _percentil(valores, p):
+        """Percentil p (0..1) pelo método do posto mais próximo."""
+        if not valores:
+            return 0.0
+        ordenados = sorted(valores)
+        return ordenados[min(len(ordenados) - 1, max(0, math.ceil(p * len(ordenados)) - 1))]
+
+# =============================================================================
+# VARREDURA DE PARÂMETROS (MONTE CARLO EM PARALELO)
+# =============================================================================
+
+# Valores críticos t de Student (bicaudal, 95%) para 1..30 graus de liberdade
+_T_95 = (12.706, 4.303, 3.182, 2.776, 2.571, 2.447, 2.365, 2.306, 2.262, 2.228,
+         2.201, 2.179, 2.160, 2.145, 2.131, 2.120, 2.110, 2.101, 2.093, 2.086,
+         2.080, 2.074, 2.069, 2.064, 2.060, 2.056, 2.052, 2.048, 2.045, 2.042)
+
+def _rodar_replicacao(cenario, seed, n_clientes):
+    """
+    Executa uma replicação de um cenário (função de módulo, para poder ser
+    enviada aos processos do pool). As distribuições são exponenciais.
+    """
+    paciencia = cenario.get('paciencia_media_min')
+    simulacao = SimulacaoBandejao(
+        chegadas=exponencial(1 / cenario['taxa_chegada_por_min']),
+        atendimento=exponencial(cenario['tempo_medio_atendimento_min']),
+        paciencia=exponencial(paciencia) if paciencia else None,
+        seed=seed,
+        tempo_medio_atendimento_min=cenario['tempo_medio_atendimento_min'],
+        n_balcoes=cenario.get('n_balcoes', 1),
+        politica=cenario.get('politica', 'menor_fila'))
+    return simulacao.executar(n_clientes=n_clientes)
+
+def _chave_cenario(cenario, n_clientes, semente_base):
+    """
+    Identifica as replicações de um cenário no arquivo: inclui n_clientes e a
+    semente base, para que retomar com outros valores não reaproveite (nem
+    misture no resumo) resultados que não são comparáveis.
+    """
+    return json.dumps({'cenario': cenario, 'n_clientes': n_clientes, 'semente_base': semente_base},
+                      sort_keys=True)
+
+def expandir_grade(grade):
+    """Gera todos os cenários (dicionários) do produto cartesiano da grade."""
+    nomes = sorted(grade)
+    return [dict(zip(nomes, valores)) for valores in itertools.product(*(grade[n] for n in nomes))]
+
+def executar_varredura(grade, replicacoes, arquivo, n_clientes=10_000, n_processos=None, semente_base=0):
+    """
+    Roda replicacoes simulações independentes para cada cenário da grade em um
+    ProcessPoolExecutor e grava cada resultado, assim que fica pronto, como uma
+    linha JSON em arquivo. Replicações já presentes no arquivo são puladas, o
+    que permite retomar uma varredura interrompida (só contam como feitas as
+    replicações com os mesmos n_clientes e semente_base). Retorna o resumo com
+    intervalos de confiança (ver resumir_varredura).
+
+    :param grade: Dicionário parâmetro -> lista de valores, ex:
+                  {'tempo_medio_atendimento_min': [1, 2], 'taxa_chegada_por_min': [0.5],
+                   'n_balcoes': [1, 2]}.
+    :param replicacoes: Número de replicações por cenário.
+    :param arquivo: Caminho do arquivo JSONL de resultados.
+    :param n_processos: Número de processos (padrão: número de núcleos).
+    :param semente_base: Semente base; cada replicação recebe uma semente derivada dela.
+    """
+    feitos = set()
+    if os.path.exists(arquivo):
+        _descartar_linha_incompleta(arquivo)
+        for registro in _ler_resultados(arquivo):
+            feitos.add((registro['cenario_chave'], registro['replicacao']))
+
+    tarefas = []
+    for cenario in expandir_grade(grade):
+        chave = _chave_cenario(cenario, n_clientes, semente_base)
+        for r in range(replicacoes):
+            if (chave, r) not in feitos:
+                tarefas.append((cenario, chave, r))
+
+    if tarefas:
+        with open(arquivo, 'a', encoding='utf-8') as saida, \
+                concurrent.futures.ProcessPoolExecutor(max_workers=n_processos) as pool:
+            futuros = {pool.submit(_rodar_replicacao, cenario, f"{chave}:{r}", n_clientes):
+                       (cenario, chave, r) for cenario, chave, r in tarefas}
+            for futuro in concurrent.futures.as_completed(futuros):
+                cenario, chave, r = futuros[futuro]
+                registro = {'cenario_chave': chave, 'cenario': cenario, 'n_clientes': n_clientes,
+                            'semente_base': semente_base, 'replicacao': r, **futuro.result()}
+                saida.write(json.dumps(registro) + "\n")
+                saida.flush()
+    return resumir_varredura(arquivo)
+
+def _descartar_linha_incompleta(arquivo):
+    """Trunca o arquivo na última quebra de linha, descartando um registro cuja escrita foi interrompida."""
+    with open(arquivo, 'rb+') as f:
+        conteudo = f.read()
+        if conteudo and not conteudo.endswith(b"\n"):
+            f.truncate(conteudo.rfind(b"\n") + 1)
+
+def _ler_resultados(arquivo):
+    """Lê o arquivo JSONL, ignorando uma última linha incompleta (interrupção na escrita)."""
+    with open(arquivo, encoding='utf-8') as entrada:
+        for linha in entrada:
+            try:
+                yield json.loads(linha)
+            except json.JSONDecodeError:
+                continue
+
+def resumir_varredura(arquivo):
+    """
+    Agrega os resultados do arquivo por cenário: para cada métrica numérica,
+    a média entre replicações e a meia-largura do intervalo de confiança de 95%
+    (t de Student). Retorna uma lista de dicionários, um por cenário.
+    """
+    por_cenario = {}
+    for registro in _ler_resultados(arquivo):
+        por_cenario.setdefault(registro['cenario_chave'], []).append(registro)
+    resumo = []
+    for registros in por_cenario.values():
+        linha = dict(registros[0]['cenario'])
+        linha['n_clientes'] = registros[0].get('n_clientes')
+        linha['semente_base'] = registros[0].get('semente_base')
+        linha['replicacoes'] = n = len(registros)
+        metricas = [k for k, v in registros[0].items()
+                    if isinstance(v, (int, float)) and k not in ('replicacao', 'n_clientes', 'semente_base')]
+        for metrica in metricas:
+            valores = [r[metrica] for r in registros]
+            media = sum(valores) / n
+            if n > 1:
+                desvio = math.sqrt(sum((v - media) ** 2 for v in valores) / (n - 1))
+                t = _T_95[n - 2] if n - 1 <= len(_T_95) else 1.96
+                meia_largura = t * desvio / math.sqrt(n)
+            else:
+                meia_largura = float('nan')
+            linha[metrica] = media
+            linha[metrica + '_ic95'] = meia_largura
+        resumo.append(linha)
+    return resumo
+
+def salvar_resumo_csv(resumo, caminho):
+    """Grava o resumo de uma varredura em CSV."""
+    colunas = []
+    for linha in resumo:
+        colunas.extend(k for k in linha if k not in colunas)
+    with open(caminho, 'w', newline='', encoding='utf-8') as saida:
+        escritor = csv.DictWriter(saida, fieldnames=colunas)
+        escritor.writeheader()
+        escritor.writerows(resumo)
+
+# =============================================================================
+# BLOCO DE TESTE
+# =============================================================================
+
+if __name__ == "__main__":
+    # --- Teste da Classe Lista Duplamente Encadeada ---
+    print("--- Teste: Lista Duplamente Encadeada ---")
+    lista_d = ListaDuplamenteEncadeada([10, 30, 20])
+    print(f"Lista inicial: {lista_d}")
+    lista_d.push(0)
+    lista_d.push_back(40)
+    print(f"Após push(0) e push_back(40): {lista_d}")
+    print(f"Pop: {lista_d.pop()}, Pop Back: {lista_d.pop_back()}")
+    print(f"Lista após pops: {lista_d}")
+    print("Ordenando a lista com sort (merge sort natural)...")
+    lista_d.sort()
+    print(f"Lista ordenada: {lista_d}")
+    outra = ListaDuplamenteEncadeada([5, 25, 35])
+    lista_d.merge(outra)
+    print(f"Após merge com [5, 25, 35]: {lista_d}, outra: {outra}")
+    soma = sum(lista_d.find_at(i) for i in range(len(lista_d)))   # O(1) por acesso, via dedo
+    print(f"Soma por acesso posicional sequencial: {soma}")
+    print("-" * 40)
+
+    # --- Teste da Lista Duplamente Encadeada Compacta ---
+    print("\n--- Teste: Lista Duplamente Encadeada Compacta ---")
+    lista_c = ListaDuplamenteEncadeadaCompacta([10, 30, 20])
+    lista_c.push(0)
+    lista_c.push_back(40)
+    print(f"Após push(0) e push_back(40): {lista_c}")
+    print(f"Pop: {lista_c.pop()}, Pop Back: {lista_c.pop_back()}")
+    lista_c.push_back(50)   # reaproveita uma posição da lista livre
+    print(f"Após push_back(50): {lista_c}, posições alocadas: {len(lista_c._data)}")
+    print("-" * 40)
+
+    # --- Teste da Classe Fila ---
+    print("\n--- Teste: Fila ---")
+    fila = Fila()
+    fila.enqueue('X'); fila.enqueue('Y'); fila.enqueue('Z')
     print(f"Fila: {fila}")
     print(f"Primeiro (peek): {fila.peek()}")
     print(f"Dequeue: {fila.dequeue()}")
     print(f"Fila após dequeue: {fila}")
+    handle_w = fila.enqueue('W')
+    print(f"Cancelando 'W' pelo handle: {fila.cancel(handle_w)}, de novo: {fila.cancel(handle_w)}, fila: {fila}")
+    outra_fila = Fila()
+    print(f"Handle de outra fila é recusado: {fila.cancel(outra_fila.enqueue('V'))}, outra fila: {outra_fila}")
+    print("-" * 40)
+
+    # --- Teste do Deque Circular e da Fila Circular ---
+    print("\n--- Teste: Deque Circular e Fila Circular (ring buffer) ---")
+    deque_c = DequeCircular(capacidade=4, politica='crescer')
+    for i in range(3): deque_c.push_back(i)
+    deque_c.push(-1); deque_c.push(-2)   # cheio: dobra a capacidade
+    print(f"{deque_c}; pop: {deque_c.pop()}, pop_back: {deque_c.pop_back()}")
+    telemetria = FilaCircular(capacidade=3, politica='sobrescrever', typecode='d')
+    for leitura in (20.5, 21.0, 21.7, 22.1, 22.4):
+        descartada = telemetria.enqueue(leitura)
+        if descartada is not None: print(f"Cheia (is_full={telemetria.is_full()}): descartou {descartada}")
+    print(f"Últimas leituras: {list(telemetria)}")
+    limitada = FilaCircular(capacidade=2)
+    limitada.enqueue('a'); limitada.enqueue('b')
+    try:
+        limitada.enqueue('c')
+    except IndexError as erro:
+        print(f"Política 'rejeitar': {erro}")
+    print("-" * 40)
+
+    # --- Teste da Fila que Transborda para o Disco ---
+    print("\n--- Teste: Fila em Disco (memória limitada) ---")
+    with FilaEmDisco(limite_memoria=2_000) as fila_d:
+        for i in range(50_000):
+            fila_d.enqueue({'pedido': i})
+        print(fila_d)
+        print(f"Desistência no meio (em disco): {fila_d.remove_item({'pedido': 25_000})}")
+        primeiros = [fila_d.dequeue()['pedido'] for _ in range(3)]
+        restantes = [pedido['pedido'] for pedido in fila_d]
+        print(f"Primeiros: {primeiros}; restam {len(restantes)} em ordem? {restantes == [i for i in range(3, 50_000) if i != 25_000]}")
+        while not fila_d.is_empty():
+            fila_d.dequeue()
+        print(f"Após esvaziar: {fila_d}; arquivos restantes: {len(os.listdir(fila_d.diretorio))}")
+    print("-" * 40)
+
+    # --- Teste da Fila e da Pilha Concorrentes ---
+    print("\n--- Teste: Fila e Pilha Concorrentes (threads) ---")
+    fila_c = FilaConcorrente(capacidade=3)
+    print(f"Enfileirados em lote: {fila_c.enqueue_many(['a', 'b', 'c', 'd'], timeout=0.1)} de 4, cheia? {fila_c.is_full()}")
+    try:
+        fila_c.put('d', timeout=0.1)
+    except TimeoutError as erro:
+        print(f"put com timeout: {erro}")
+    print(f"Lote retirado: {fila_c.dequeue_many(10)}")
+    pilha_c = PilhaConcorrente()
+    pilha_c.push_many([1, 2, 3])
+    print(f"Pilha: {pilha_c}, pop_many(2): {pilha_c.pop_many(2)}")
+    print("Vazão (itens/s) com N produtoras e N consumidoras:")
+    for n_threads in (1, 4, 16):
+        item_a_item = medir_vazao_concorrente(n_threads, n_itens=50_000)
+        em_lote = medir_vazao_concorrente(n_threads, n_itens=50_000, lote=64)
+        print(f"  {n_threads:2d} threads: item a item {item_a_item:10,.0f} | lotes de 64 {em_lote:10,.0f}")
+    print("-" * 40)
+
+    # --- Teste da Fila Assíncrona ---
+    print("\n--- Teste: Fila Assíncrona (asyncio) ---")
+
+    async def demonstrar_async_fila():
+        fila_a = AsyncFila(limite_alto=20_000, limite_baixo=5_000)
+        suspensoes = 0
+
+        async def produtor():
+            nonlocal suspensoes
+            for i in range(100_000):
+                if fila_a.is_full(): suspensoes += 1
+                await fila_a.put(i)
+
+        async def consumidor():
+            recebidos = lotes = 0
+            while recebidos < 100_000:
+                recebidos += len(await fila_a.get_batch(20_000))
+                lotes += 1
+            return lotes
+
+        _, lotes = await asyncio.gather(produtor(), consumidor())
+        print(f"100.000 itens em {lotes} lotes; produtor suspenso {suspensoes} vezes pelo limite alto")
+        print(f"get_batch com timeout em fila vazia: {await fila_a.get_batch(10, timeout=0.01)}")
+        espera = asyncio.ensure_future(fila_a.get())
+        await asyncio.sleep(0)
+        espera.cancel()
+        fila_a.put_nowait('pedido')
+        print(f"Após cancelar um get pendente, o item continua na fila: {list(fila_a)}")
+
+    asyncio.run(demonstrar_async_fila())
+    print("-" * 40)
+
+    # --- Teste da Fila em Memória Compartilhada ---
+    print("\n--- Teste: Fila em Memória Compartilhada (processos) ---")
+    with FilaMemoriaCompartilhada(capacidade_bytes=64) as fila_shm:
+        fila_shm.enqueue(b"pedido 1")
+        visao = fila_shm.reservar(8)      # escrita sem cópia intermediária
+        visao[:] = b"pedido 2"
+        fila_shm.publicar()
+        print(f"{fila_shm}; vazia? {fila_shm.is_empty()}, cheia? {fila_shm.is_full()}")
+        visao = fila_shm.dequeue_view()   # leitura sem cópia
+        print(f"Lido pela memoryview: {bytes(visao)}")
+        fila_shm.confirmar_leitura()
+        print(f"dequeue: {fila_shm.dequeue()}")
+        for _ in range(2):                # leva o fim da fila para perto do fim do buffer
+            fila_shm.enqueue(bytes(12))
+            fila_shm.dequeue()
+        grande = bytes(range(28))         # 32 bytes com o prefixo: dá a volta no buffer
+        fila_shm.put(grande, timeout=1)
+        print(f"Registro de 28 bytes que deu a volta lido intacto? {fila_shm.get(timeout=1) == grande}")
+        try:
+            fila_shm.enqueue(bytes(40))
+        except ValueError as erro:
+            print(f"Registro grande demais: {erro}")
+        fila_shm.unlink()
+    vazoes = medir_vazao_entre_processos(n_mensagens=50_000, tamanho=64)
+    for nome_fila, vazao in vazoes.items():
+        print(f"  {nome_fila:26s} {vazao:10,.0f} mensagens/s (64 bytes, processo -> processo)")
+    print("-" * 40)
+
+    # --- Teste da Lista Desenrolada (como armazenamento da Fila e da Pilha) ---
+    print("\n--- Teste: Lista Desenrolada ---")
+    lista_u = ListaDesenrolada(range(10), tamanho_bloco=4)
+    lista_u.insert_at(2, 'meio')
+    print(f"Após insert_at(2, 'meio'): {lista_u}")
+    print(f"remove_at(5): {lista_u.remove_at(5)}, find_at(7): {lista_u.find_at(7)}")
+    fila_u = Fila(ListaDesenrolada(tamanho_bloco=4))
+    for letra in "ABCDEF": fila_u.enqueue(letra)
+    print(f"Fila desenrolada: dequeue -> {fila_u.dequeue()}, itens: {list(fila_u)}")
+    pilha_u = Pilha(ListaDesenrolada(tamanho_bloco=4))
+    for letra in "XYZ": pilha_u.push(letra)
+    print(f"Pilha desenrolada: peek -> {pilha_u.peek()}, pop -> {pilha_u.pop()}")
+    print("-" * 40)
+
+    # --- Teste da Lista de Saltos Indexada ---
+    print("\n--- Teste: Lista de Saltos Indexada ---")
+    lista_skip = ListaDeSaltosIndexada(range(0, 50, 10), seed=42)
+    lista_skip.insert_at(2, 15)
+    print(f"Após insert_at(2, 15): {lista_skip}")
+    print(f"find_at(3): {lista_skip.find_at(3)}, remove_at(0): {lista_skip.remove_at(0)}")
+    lista_skip.swap(0, 4)
+    print(f"Após swap(0, 4): {lista_skip}")
     print("-" * 40)
 
     # --- Teste da Fila de Prioridades ---
@@ -438,14 +3379,101 @@ if __name__ == "__main__":
         print(f"- Atendendo: {tarefa['tarefa']} (Prioridade: {tarefa['prioridade']})")
     print("-" * 40)
 
+    # --- Teste da Fila de Prioridades com Heap ---
+    print("\n--- Teste: Fila de Prioridades (Heap) ---")
+    fila_h = FilaDePrioridadesHeap()
+    fila_h.insert_ordered({'tarefa': 'Lavar louça', 'prioridade': 3})
+    h_conta = fila_h.insert_ordered({'tarefa': 'Pagar conta', 'prioridade': 1})
+    h_lixo = fila_h.insert_ordered({'tarefa': 'Tirar o lixo', 'prioridade': 2})
+    fila_h.insert_ordered({'tarefa': 'Estudar POO', 'prioridade': 2})
+    h_conta.item['prioridade'] = 4
+    h_conta.change_priority()   # recalcula a chave a partir do item
+    print(f"Cancelando 'Tirar o lixo': {h_lixo.cancel()}, de novo: {h_lixo.cancel()}")
+    print("Atendendo tarefas por prioridade:")
+    while not fila_h.is_empty():
+        tarefa = fila_h.get_highest_priority()
+        print(f"- Atendendo: {tarefa['tarefa']} (Prioridade: {tarefa['prioridade']})")
+    print("-" * 40)
+
+    # --- Teste da Fila de Prioridades por Baldes ---
+    print("\n--- Teste: Fila de Prioridades (Baldes) ---")
+    fila_b = nova_fila_de_prioridades('baldes', niveis=4)
+    for tarefa, prioridade in [('Lavar louça', 3), ('Pagar conta', 1), ('Estudar POO', 2), ('Pagar aluguel', 1)]:
+        fila_b.insert_ordered({'tarefa': tarefa, 'prioridade': prioridade})
+    print("Atendendo tarefas por prioridade:")
+    while not fila_b.is_empty():
+        tarefa = fila_b.get_highest_priority()
+        print(f"- Atendendo: {tarefa['tarefa']} (Prioridade: {tarefa['prioridade']})")
+    print("-" * 40)
+
     # --- Teste da Fila do Bandejão ---
     print("\n--- Teste: Problema da Fila do Bandejão ---")
     bandejao = FilaBandejao(tempo_medio_atendimento_min=1)
     user_ana = bandejao.entrar_na_fila("Ana")
     user_bruno = bandejao.entrar_na_fila("Bruno")
     user_carla = bandejao.entrar_na_fila("Carla")
+    user_davi = bandejao.entrar_na_fila("Davi", tempo_atendimento_min=3)
     bandejao.visualizar_fila()
     bandejao.atender_proximo()
     bandejao.desistir(user_carla)
     bandejao.visualizar_fila()
+    print(f"Posição de Davi: {bandejao.posicao(user_davi)}, Carla (desistiu) tinha estimativa {user_carla.hora_estimada_atendimento.strftime('%H:%M:%S')}")
+    print("-" * 40)
+
+    # --- Teste das Desistências Automáticas (Roda de Temporização) ---
+    print("\n--- Teste: Desistências Automáticas por Paciência ---")
+    relogio = RelogioVirtual()
+    bandejao = FilaBandejao(tempo_medio_atendimento_min=2, relogio=relogio.agora, paciencia_min=5)
+    for nome in ("Ana", "Bruno", "Carla"):
+        bandejao.entrar_na_fila(nome)
+    bandejao.entrar_na_fila("Davi", paciencia_min=1)
+    relogio.avancar_para(2)
+    bandejao.atender_proximo()          # Davi já desistiu (paciência de 1 min)
+    relogio.avancar_para(6)
+    bandejao.visualizar_fila()          # Bruno e Carla passaram dos 5 min
+    roda = RodaDeTemporizacao(resolucao=1.0, slots=64, niveis=3)
+    temporizadores = [roda.agendar(t, lambda: None) for t in range(1, 10_001)]
+    for temporizador in temporizadores[::2]:
+        temporizador.cancel()
+    print(f"\nRoda: {len(roda)} prazos pendentes; {roda.avancar(5_000)} dispararam até t=5000")
+    print("-" * 40)
+
+    # --- Teste do Bandejão com Vários Balcões ---
+    print("\n--- Teste: Bandejão com Vários Balcões ---")
+    multi = BandejaoMultiBalcao(tempos_medios_min=(1, 2), politica='menor_fila')
+    clientes = [multi.entrar_na_fila(nome) for nome in ("Ana", "Bruno", "Carla", "Davi", "Eva", "Fábio")]
+    print(f"\nEspera estimada (todos os balcões): {multi.estimar_tempo_espera()}")
+    for _ in range(4):
+        roubado = multi.atender_proximo(0)   # na 4ª vez a fila 1 está vazia: atende o último da fila 2
+    print(f"{roubado.nome} termina às {roubado.hora_estimada_atendimento.strftime('%H:%M:%S')} no balcão 1")
+    multi.entrar_na_fila("Gabi")   # o balcão 1 ainda está ocupado com quem veio da fila 2
+    multi.desistir(clientes[3])
+    multi.visualizar_fila()
+    print("-" * 40)
+
+    # --- Teste da Simulação de Eventos Discretos ---
+    print("\n--- Teste: Simulação do Bandejão (tempo virtual) ---")
+    simulacao = SimulacaoBandejao(chegadas=exponencial(1.0), atendimento=exponencial(0.9),
+                                  paciencia=exponencial(15), seed=42)
+    resultado = simulacao.executar(n_clientes=10_000)
+    for chave, valor in resultado.items():
+        print(f"{chave}: {valor:.2f}" if isinstance(valor, float) else f"{chave}: {valor}")
+    print("-" * 40)
+
+    # --- Teste da Varredura de Parâmetros em Paralelo ---
+    print("\n--- Teste: Varredura de Parâmetros (processos em paralelo) ---")
+    grade = {'tempo_medio_atendimento_min': [0.8, 1.6], 'taxa_chegada_por_min': [1.0], 'n_balcoes': [1, 2]}
+    with tempfile.TemporaryDirectory() as pasta:
+        caminho = os.path.join(pasta, "varredura.jsonl")
+        resumo = executar_varredura(grade, replicacoes=4, arquivo=caminho, n_clientes=2_000, n_processos=2)
+        for linha in resumo:
+            print(f"t={linha['tempo_medio_atendimento_min']} balcões={linha['n_balcoes']}: "
+                  f"espera média {linha['espera_media_min']:.2f} ± {linha['espera_media_min_ic95']:.2f} min")
+        # Rodar de novo retoma do arquivo: nenhuma replicação é refeita
+        executar_varredura(grade, replicacoes=4, arquivo=caminho, n_clientes=2_000, n_processos=2)
+        with open(caminho) as arquivo:
+            print(f"Linhas no arquivo após retomar: {sum(1 for _ in arquivo)}")
+        # Com outro n_clientes as replicações anteriores não valem: cada cenário roda de novo
+        resumo = executar_varredura(grade, replicacoes=4, arquivo=caminho, n_clientes=1_000, n_processos=2)
+        print(f"Cenários no resumo com n_clientes=2000 e 1000: {len(resumo)}")
     print("-" * 40)
\ No newline at end of file